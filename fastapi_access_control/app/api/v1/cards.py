@@ -32,6 +32,61 @@ router = APIRouter(
 )
 
 
+def get_create_card_use_case(
+    card_repository: CardRepositoryPort = Depends(get_card_repository),
+    user_repository: UserRepositoryPort = Depends(get_user_repository)
+) -> CreateCardUseCase:
+    return CreateCardUseCase(card_repository, user_repository)
+
+
+def get_card_use_case(
+    card_repository: CardRepositoryPort = Depends(get_card_repository)
+) -> GetCardUseCase:
+    return GetCardUseCase(card_repository)
+
+
+def get_card_by_card_id_use_case(
+    card_repository: CardRepositoryPort = Depends(get_card_repository)
+) -> GetCardByCardIdUseCase:
+    return GetCardByCardIdUseCase(card_repository)
+
+
+def get_user_cards_use_case(
+    card_repository: CardRepositoryPort = Depends(get_card_repository)
+) -> GetUserCardsUseCase:
+    return GetUserCardsUseCase(card_repository)
+
+
+def get_list_cards_use_case(
+    card_repository: CardRepositoryPort = Depends(get_card_repository)
+) -> ListCardsUseCase:
+    return ListCardsUseCase(card_repository)
+
+
+def get_update_card_use_case(
+    card_repository: CardRepositoryPort = Depends(get_card_repository)
+) -> UpdateCardUseCase:
+    return UpdateCardUseCase(card_repository)
+
+
+def get_deactivate_card_use_case(
+    card_repository: CardRepositoryPort = Depends(get_card_repository)
+) -> DeactivateCardUseCase:
+    return DeactivateCardUseCase(card_repository)
+
+
+def get_suspend_card_use_case(
+    card_repository: CardRepositoryPort = Depends(get_card_repository)
+) -> SuspendCardUseCase:
+    return SuspendCardUseCase(card_repository)
+
+
+def get_delete_card_use_case(
+    card_repository: CardRepositoryPort = Depends(get_card_repository)
+) -> DeleteCardUseCase:
+    return DeleteCardUseCase(card_repository)
+
+
 @router.post(
     "/",
     response_model=CardResponse,
@@ -77,16 +132,14 @@ router = APIRouter(
 )
 async def create_card(
     card_data: CreateCardRequest = Body(..., description="Card creation data"),
-    card_repository: CardRepositoryPort = Depends(get_card_repository),
-    user_repository: UserRepositoryPort = Depends(get_user_repository),
+    use_case: CreateCardUseCase = Depends(get_create_card_use_case),
     current_user = Depends(get_current_active_user)
 ):
     """Create a new access card"""
     try:
         logger.info(f"Creating card {card_data.card_id} for user {card_data.user_id}")
         
-        create_card_use_case = CreateCardUseCase(card_repository, user_repository)
-        card = await create_card_use_case.execute(
+        card = await use_case.execute(
             card_id=card_data.card_id,
             user_id=card_data.user_id,
             card_type=card_data.card_type.value,
@@ -112,13 +165,12 @@ async def create_card(
 )
 async def get_card(
     card_id: UUID,
-    card_repository: CardRepositoryPort = Depends(get_card_repository),
+    use_case: GetCardUseCase = Depends(get_card_use_case),
     current_user = Depends(get_current_active_user)
 ):
     """Get a card by its database ID"""
     try:
-        get_card_use_case = GetCardUseCase(card_repository)
-        card = await get_card_use_case.execute(card_id)
+        card = await use_case.execute(card_id)
         return CardResponse.model_validate(card, from_attributes=True) 
     except Exception as e:
         logger.error(f"Error getting card {card_id}: {str(e)}")
@@ -135,13 +187,12 @@ async def get_card(
 )
 async def get_card_by_card_id(
     card_id: str,
-    card_repository: CardRepositoryPort = Depends(get_card_repository),
+    use_case: GetCardByCardIdUseCase = Depends(get_card_by_card_id_use_case),
     current_user = Depends(get_current_active_user)
 ):
     """Get a card by its physical card ID"""
     try:
-        get_card_use_case = GetCardByCardIdUseCase(card_repository)
-        card = await get_card_use_case.execute(card_id)
+        card = await use_case.execute(card_id)
         return CardResponse.model_validate(card, from_attributes=True)
     except Exception as e:
         logger.error(f"Error getting card by card_id {card_id}: {str(e)}")
@@ -155,13 +206,12 @@ async def get_card_by_card_id(
 )
 async def get_user_cards(
     user_id: UUID,
-    card_repository: CardRepositoryPort = Depends(get_card_repository),
+    use_case: GetUserCardsUseCase = Depends(get_user_cards_use_case),
     current_user = Depends(get_current_active_user)
 ):
     """Get all cards for a user"""
     try:
-        get_user_cards_use_case = GetUserCardsUseCase(card_repository)
-        cards = await get_user_cards_use_case.execute(user_id)
+        cards = await use_case.execute(user_id)
         return [CardResponse.model_validate(card, from_attributes=True) for card in cards]
     except Exception as e:
         logger.error(f"Error getting cards for user {user_id}: {str(e)}")
@@ -176,13 +226,12 @@ async def get_user_cards(
 async def list_cards(
     skip: int = Query(0, ge=0, description="Number of cards to skip"),
     limit: int = Query(get_settings().DEFAULT_PAGE_SIZE, ge=1, le=get_settings().MAX_PAGE_SIZE, description="Maximum number of cards to return"),
-    card_repository: CardRepositoryPort = Depends(get_card_repository),
+    use_case: ListCardsUseCase = Depends(get_list_cards_use_case),
     current_user = Depends(get_current_active_user)
 ):
     """List cards with pagination"""
     try:
-        list_cards_use_case = ListCardsUseCase(card_repository)
-        cards = await list_cards_use_case.execute(skip, limit)
+        cards = await use_case.execute(skip, limit)
         
         # Get total count (simplified - in production, you'd want a separate count method)
         total = len(cards) + skip  # This is a simplified approach
@@ -206,15 +255,14 @@ async def list_cards(
 async def update_card(
     card_id: UUID,
     card_data: UpdateCardRequest = Body(..., description="Card update data"),
-    card_repository: CardRepositoryPort = Depends(get_card_repository),
+    use_case: UpdateCardUseCase = Depends(get_update_card_use_case),
     current_user = Depends(get_current_active_user)
 ):
     """Update a card"""
     try:
         logger.info(f"Updating card {card_id}")
         
-        update_card_use_case = UpdateCardUseCase(card_repository)
-        card = await update_card_use_case.execute(
+        card = await use_case.execute(
             card_id=card_id,
             card_type=card_data.card_type.value if card_data.card_type else None,
             status=card_data.status.value if card_data.status else None,
@@ -236,15 +284,14 @@ async def update_card(
 )
 async def deactivate_card(
     card_id: UUID,
-    card_repository: CardRepositoryPort = Depends(get_card_repository),
+    use_case: DeactivateCardUseCase = Depends(get_deactivate_card_use_case),
     current_user = Depends(get_current_active_user)
 ):
     """Deactivate a card"""
     try:
         logger.info(f"Deactivating card {card_id}")
         
-        deactivate_card_use_case = DeactivateCardUseCase(card_repository)
-        card = await deactivate_card_use_case.execute(card_id)
+        card = await use_case.execute(card_id)
         
         logger.info(f"Card {card_id} deactivated successfully")
         return CardResponse.model_validate(card, from_attributes=True)
@@ -261,15 +308,14 @@ async def deactivate_card(
 )
 async def suspend_card(
     card_id: UUID,
-    card_repository: CardRepositoryPort = Depends(get_card_repository),
+    use_case: SuspendCardUseCase = Depends(get_suspend_card_use_case),
     current_user = Depends(get_current_active_user)
 ):
     """Suspend a card"""
     try:
         logger.info(f"Suspending card {card_id}")
         
-        suspend_card_use_case = SuspendCardUseCase(card_repository)
-        card = await suspend_card_use_case.execute(card_id)
+        card = await use_case.execute(card_id)
         
         logger.info(f"Card {card_id} suspended successfully")
         return CardResponse.model_validate(card, from_attributes=True)
@@ -286,15 +332,14 @@ async def suspend_card(
 )
 async def delete_card(
     card_id: UUID,
-    card_repository: CardRepositoryPort = Depends(get_card_repository),
+    use_case: DeleteCardUseCase = Depends(get_delete_card_use_case),
     current_user = Depends(get_current_active_user)
 ):
     """Delete a card"""
     try:
         logger.info(f"Deleting card {card_id}")
         
-        delete_card_use_case = DeleteCardUseCase(card_repository)
-        deleted = await delete_card_use_case.execute(card_id)
+        deleted = await use_case.execute(card_id)
         
         if not deleted:
             raise HTTPException(
@@ -2,10 +2,10 @@
 Refactored Permission repository implementation using consistent session_factory pattern.
 """
 from typing import Optional, List, Callable
-from datetime import time
+from datetime import datetime, time
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
-from sqlalchemy import select, and_, or_
+from sqlalchemy import select, func, and_, or_
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.ports.permission_repository_port import PermissionRepositoryPort
@@ -206,6 +206,51 @@ class PermissionRepository(PermissionRepositoryPort):
                 logger.error(f"Database error listing permissions: {e}")
                 raise RepositoryError(f"Failed to list permissions: {e}") from e
     
+    async def count_permissions(self,
+                              user_id: Optional[UUID] = None,
+                              door_id: Optional[UUID] = None,
+                              card_id: Optional[UUID] = None,
+                              status: Optional[str] = None,
+                              created_by: Optional[UUID] = None,
+                              valid_only: Optional[bool] = None,
+                              expired_only: Optional[bool] = None) -> int:
+        """Count permissions matching filters."""
+        async with self.session_factory() as session:
+            try:
+                conditions = []
+                if user_id:
+                    conditions.append(PermissionModel.user_id == user_id)
+                if door_id:
+                    conditions.append(PermissionModel.door_id == door_id)
+                if card_id:
+                    conditions.append(PermissionModel.card_id == card_id)
+                if status:
+                    conditions.append(PermissionModel.status == status)
+                if created_by:
+                    conditions.append(PermissionModel.created_by == created_by)
+                
+                # Same validity rules as Permission.is_active / is_expired
+                now = datetime.now()
+                if valid_only:
+                    conditions.append(and_(
+                        PermissionModel.status == "active",
+                        PermissionModel.valid_from <= now,
+                        or_(
+                            PermissionModel.valid_until.is_(None),
+                            PermissionModel.valid_until >= now
+                        )
+                    ))
+                if expired_only:
+                    conditions.append(PermissionModel.valid_until < now)
+                
+                query = select(func.count()).select_from(PermissionModel).where(*conditions)
+                result = await session.execute(query)
+                return result.scalar_one()
+                
+            except SQLAlchemyError as e:
+                logger.error(f"Database error counting permissions: {e}")
+                raise RepositoryError(f"Failed to count permissions: {e}") from e
+    
     async def get_active_permissions(self) -> List[Permission]:
         """Get all active permissions."""
         async with self.session_factory() as session:
@@ -1,9 +1,9 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func, or_
 from typing import Optional, List, Callable
 from uuid import UUID
 from app.ports.user_repository_port import UserRepositoryPort
-from app.domain.entities.user import User
+from app.domain.entities.user import User, UserStatus
 from app.infrastructure.database.models.user import UserModel
 from app.infrastructure.persistence.adapters.mappers.user_mapper import UserMapper
 from sqlalchemy.exc import SQLAlchemyError
@@ -112,4 +112,28 @@ class SqlAlchemyUserRepository(UserRepositoryPort):
                 return [UserMapper.to_domain(model) for model in user_models]
             except SQLAlchemyError as e:
                 logger.error(f"Database error listing users: {e}")
-                raise RepositoryError(f"Error listing users: {e}") from e 
\ No newline at end of file
+                raise RepositoryError(f"Error listing users: {e}") from e 
+    
+    async def count_users(self,
+                         status: Optional[str] = None,
+                         role: Optional[str] = None,
+                         search: Optional[str] = None) -> int:
+        async with self.session_factory() as db:
+            try:
+                query = select(func.count()).select_from(UserModel)
+                if status:
+                    # The table stores only is_active; UserMapper reads every non-active row as inactive
+                    query = query.where(UserModel.is_active.is_(status == UserStatus.ACTIVE.value))
+                if role:
+                    query = query.where(UserModel.roles.any(role))
+                if search:
+                    pattern = f"%{search}%"
+                    query = query.where(or_(
+                        UserModel.email.ilike(pattern),
+                        UserModel.full_name.ilike(pattern)
+                    ))
+                result = await db.execute(query)
+                return result.scalar_one()
+            except SQLAlchemyError as e:
+                logger.error(f"Database error counting users: {e}")
+                raise RepositoryError(f"Error counting users: {e}") from e
@@ -0,0 +1,59 @@
+"""
+Latency guardrails for the card endpoints.
+
+Marked `bench`, which the default run deselects; run them with `make test-bench`
+(`pytest tests/benchmarks -m bench --benchmark-only --benchmark-enable`).
+"""
+import pytest
+import orjson
+from app.api.v1.cards import router as cards_router
+from tests.conftest import SAMPLE_CARD_UUID
+from tests.card_api_data import CARD, LIST_CARDS, CREATE_CARD_BYTES
+
+pytestmark = pytest.mark.bench
+
+# conftest's api_app carries only these routers, so the rate limiter never answers 429
+API_ROUTERS = (cards_router,)
+
+@pytest.mark.usefixtures("_reset_overrides", "as_admin")
+class TestCardsBenchmarks:
+    """Micro-benchmarks for the card router hot paths.
+    
+    pytest-benchmark times synchronous callables, so each round drives the
+    shared api_client on the session event loop.
+    """
+    
+    def test_create_card_bench(self, benchmark, event_loop, api_client, admin_headers, card_mocks):
+        """POST /cards/ with a stubbed use case"""
+        card_mocks["CreateCardUseCase"].ret = CARD
+        headers = {**admin_headers, "content-type": "application/json"}
+        
+        response = benchmark(
+            lambda: event_loop.run_until_complete(
+                api_client.post("/api/v1/cards/", content=CREATE_CARD_BYTES, headers=headers)
+            )
+        )
+        assert response.status_code == 201
+    
+    def test_get_card_bench(self, benchmark, event_loop, api_client, admin_headers, card_mocks):
+        """GET /cards/{id} with a stubbed use case"""
+        card_mocks["GetCardUseCase"].ret = CARD
+        
+        response = benchmark(
+            lambda: event_loop.run_until_complete(
+                api_client.get(f"/api/v1/cards/{SAMPLE_CARD_UUID}", headers=admin_headers)
+            )
+        )
+        assert response.status_code == 200
+    
+    def test_list_cards_bench(self, benchmark, event_loop, api_client, admin_headers, card_mocks):
+        """GET /cards/?skip=0&limit=5 with a stubbed use case"""
+        card_mocks["ListCardsUseCase"].ret = list(LIST_CARDS)
+        
+        response = benchmark(
+            lambda: event_loop.run_until_complete(
+                api_client.get("/api/v1/cards/?skip=0&limit=5", headers=admin_headers)
+            )
+        )
+        assert response.status_code == 200
+        assert len(orjson.loads(response.content)["cards"]) == 5
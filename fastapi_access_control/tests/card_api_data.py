@@ -0,0 +1,36 @@
+"""
+Card templates shared by the cards API tests and benchmarks.
+"""
+from dataclasses import replace
+from datetime import timedelta
+from uuid import UUID
+
+import orjson
+
+from app.domain.entities.card import Card, CardType, CardStatus
+from tests.conftest import SAMPLE_USER_UUID, SAMPLE_CARD_UUID, SAMPLE_NOW
+
+# Card returned by the stubbed use cases; callers only read it
+CARD = Card(
+    id=SAMPLE_CARD_UUID,
+    card_id="CARD001",
+    user_id=SAMPLE_USER_UUID,
+    card_type=CardType.EMPLOYEE,
+    status=CardStatus.ACTIVE,
+    valid_from=SAMPLE_NOW,
+    valid_until=SAMPLE_NOW + timedelta(days=365),
+    created_at=SAMPLE_NOW,
+    updated_at=SAMPLE_NOW,
+    use_count=0
+)
+LIST_CARDS = tuple(replace(CARD, id=UUID(int=i), card_id=f"CARD{i:03d}") for i in range(1, 6))
+
+# Request bodies are serialized once at import and sent as raw JSON bytes
+CREATE_CARD_JSON = {
+    "card_id": "CARD001",
+    "user_id": str(SAMPLE_USER_UUID),
+    "card_type": "employee",
+    "valid_from": SAMPLE_NOW.isoformat(),
+    "valid_until": (SAMPLE_NOW + timedelta(days=365)).isoformat()
+}
+CREATE_CARD_BYTES = orjson.dumps(CREATE_CARD_JSON)
@@ -1,14 +1,20 @@
 # app/tests/conftest.py
 import pytest
+import pytest_asyncio
 import asyncio
 import os
-from typing import List, Tuple, Any, Dict
+from collections import Counter
+from contextlib import asynccontextmanager
+from types import MappingProxyType, SimpleNamespace
+from typing import List, Tuple, Any, Dict, Mapping, NamedTuple
 from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy import delete, event, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from httpx import AsyncClient
-from datetime import datetime, timezone, UTC, timedelta, time
+from httpx import AsyncClient, ASGITransport
+from datetime import datetime, timezone, timedelta, time
 from uuid import UUID, uuid4
 
 from app.shared.database.base import Base
@@ -22,6 +28,8 @@ from app.domain.entities.door import Door, DoorType, SecurityLevel, DoorStatus,
 from app.infrastructure.database.models.user import UserModel
 from app.infrastructure.database.models.card import CardModel
 from app.infrastructure.database.models.door import DoorModel
+from app.infrastructure.database.models.permission import PermissionModel
+from app.infrastructure.persistence.adapters.mappers.user_mapper import UserMapper
 
 # Test UUIDs for consistent testing
 SAMPLE_USER_UUID = UUID("12345678-1234-5678-9012-123456789012")
@@ -31,12 +39,27 @@ SAMPLE_CARD_UUID_2 = UUID("22222222-3333-4444-5555-666666666666")
 SAMPLE_DOOR_UUID = UUID("66666666-7777-8888-9999-000000000000")
 SAMPLE_DOOR_UUID_2 = UUID("77777777-8888-9999-0000-111111111111")
 
+# Frozen naive timestamp for mock-backed tests that only read entity dates
+SAMPLE_NOW = datetime(2024, 1, 1)
+
+# Wall-clock timestamp captured once at import for fixture rows and entities
+FIXTURE_NOW = datetime.now(timezone.utc)
+
 # Test Database
 TEST_DATABASE_URL = os.getenv(
     "DATABASE_URL", 
     "postgresql+asyncpg://postgres:postgres@db:5432/postgres_test"
 )
 
+def pytest_addoption(parser):
+    """Register the test database options"""
+    parser.addoption(
+        "--reuse-db",
+        action="store_true",
+        default=False,
+        help="Keep the test schema between runs and only truncate its tables at session start",
+    )
+
 @pytest.fixture(scope="session")
 def event_loop():
     """Create an instance of the default event loop for the test session."""
@@ -45,17 +68,47 @@ def event_loop():
     loop.close()
 
 @pytest.fixture(scope="session")
-async def test_db():
-    """Create test database"""
-    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+def worker_schema(worker_id):
+    """Postgres schema for this pytest-xdist worker; a serial run keeps the default schema"""
+    return "public" if worker_id == "master" else f"test_{worker_id}"
+
+@pytest_asyncio.fixture(scope="session")
+async def test_db(worker_schema, request):
+    """Create test database; with --reuse-db the schema is kept and only emptied"""
+    reuse_db = request.config.getoption("--reuse-db")
+    # API requests check out from this pool too (see _app_on_test_db), so leave room
+    # for the concurrent access test's in-flight repository sessions
+    engine = create_async_engine(TEST_DATABASE_URL, echo=False, pool_size=10, max_overflow=20)
+    
+    @event.listens_for(engine.sync_engine, "connect")
+    def configure_connection(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        # Test data is disposable, so commits need not wait for the WAL flush; API
+        # requests commit on these connections too, through _app_on_test_db
+        cursor.execute("SET synchronous_commit TO OFF")
+        if worker_schema != "public":
+            # Each xdist worker keeps its tables in its own schema so commits never collide
+            cursor.execute(f'CREATE SCHEMA IF NOT EXISTS "{worker_schema}"')
+            cursor.execute(f'SET search_path TO "{worker_schema}"')
+        cursor.close()
+    
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-        await conn.run_sync(Base.metadata.create_all)
+        if reuse_db:
+            # create_all skips existing tables; one TRUNCATE clears rows left by the last run
+            await conn.run_sync(Base.metadata.create_all)
+            tables = ", ".join(f'"{table.name}"' for table in Base.metadata.sorted_tables)
+            await conn.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
+        else:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
     
     yield engine
     
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+    if not reuse_db:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            if worker_schema != "public":
+                await conn.execute(text(f'DROP SCHEMA IF EXISTS "{worker_schema}" CASCADE'))
     await engine.dispose()
 
 @pytest.fixture
@@ -79,10 +132,12 @@ async def mqtt_repository(db_session):
 class MockMQTTClient:
     """Mock MQTT Client for testing"""
     
-    def __init__(self):
+    def __init__(self, connected: bool = False):
         self.published_messages: List[Tuple[str, str, int]] = []
+        # Publish count per topic, so topic assertions don't scan the messages
+        self.topic_counts: Counter[str] = Counter()
         self.subscribed_topics: List[str] = []
-        self.connected = False
+        self.connected = connected
         self.client = MagicMock()
     
     async def connect(self):
@@ -92,12 +147,13 @@ class MockMQTTClient:
     async def disconnect(self):
         """Mock disconnect"""
         self.connected = False
-        self.published_messages.clear()
+        self.clear_published_messages()
         self.subscribed_topics.clear()
     
     async def publish(self, topic: str, payload: str, qos: int = 1, retain: bool = False):
         """Mock publish - stores message for verification"""
         self.published_messages.append((topic, payload, qos))
+        self.topic_counts[topic] += 1
     
     async def subscribe(self, topic: str, qos: int = 1):
         """Mock subscribe"""
@@ -150,16 +206,16 @@ class MockMQTTClient:
     
     def assert_topic_published(self, topic: str):
         """Assert that a message was published to a specific topic"""
-        topics_published = [msg[0] for msg in self.published_messages]
-        if topic not in topics_published:
+        if not self.topic_counts[topic]:
             raise AssertionError(
                 f"No message published to topic '{topic}'\n"
-                f"Topics published to: {topics_published}"
+                f"Topics published to: {list(self.topic_counts)}"
             )
     
     def clear_published_messages(self):
         """Clear all published messages"""
         self.published_messages.clear()
+        self.topic_counts.clear()
 
 @pytest.fixture
 def mock_mqtt_client():
@@ -173,169 +229,392 @@ async def mqtt_client_connected(mock_mqtt_client):
     return mock_mqtt_client
 
 @pytest.fixture
-async def client(db_session):
-    """FastAPI test client with database dependency override"""
+async def client(_app_on_test_db):
+    """FastAPI test client whose repositories use the test engine; the app lifespan is not run"""
     from app.main import app
-    from app.shared.database.session import get_db
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+@pytest_asyncio.fixture(scope="session")
+async def aclient():
+    """Session-wide AsyncClient for mock-backed API tests.
+    
+    Requests go straight to the app through ASGITransport, which does not
+    run the application lifespan, so no MQTT or database connections are
+    started; tests override dependencies instead.
+    """
+    from app.main import app
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+@pytest.fixture(scope="module")
+def api_app(request):
+    """Application whose dependencies the override fixtures patch.
+    
+    A module that sets API_ROUTERS gets a bare FastAPI() carrying only those
+    routers, so its requests skip the main app's middleware and handlers.
+    """
+    routers = getattr(request.module, "API_ROUTERS", None)
+    if routers is None:
+        from app.main import app
+        return app
+    narrowed_app = FastAPI()
+    for router in routers:
+        narrowed_app.include_router(router, prefix="/api/v1")
+    return narrowed_app
+
+@pytest_asyncio.fixture(scope="module")
+async def api_client(api_app):
+    """AsyncClient bound to this module's api_app"""
+    async with AsyncClient(transport=ASGITransport(app=api_app), base_url="http://test") as ac:
+        yield ac
+
+@pytest.fixture
+def as_admin(api_app, sample_admin_user):
+    """Resolve api_app's current user to the sample admin without a database lookup"""
+    from app.api.dependencies.auth_dependencies import get_current_active_user
+    api_app.dependency_overrides[get_current_active_user] = lambda: sample_admin_user
+    yield
+    api_app.dependency_overrides.pop(get_current_active_user, None)
+
+@pytest.fixture
+def _reset_overrides(api_app):
+    """Restore api_app.dependency_overrides after a test that mutates them"""
+    saved_overrides = dict(api_app.dependency_overrides)
+    yield
+    api_app.dependency_overrides.clear()
+    api_app.dependency_overrides.update(saved_overrides)
+
+# RepositoryContainer getters behind the same-named providers in
+# app.api.dependencies.repository_dependencies
+REPOSITORY_PROVIDERS = (
+    "get_card_repository",
+    "get_door_repository",
+    "get_user_repository",
+    "get_permission_repository",
+    "get_mqtt_message_service",
+)
+
+@pytest.fixture(scope="session")
+def test_repository_container(test_db):
+    """RepositoryContainer whose sessions come from the worker's test engine"""
+    from app.api.dependencies.repository_dependencies import RepositoryContainer
+    return RepositoryContainer(
+        session_factory=async_sessionmaker(test_db, class_=AsyncSession, expire_on_commit=False)
+    )
+
+@pytest.fixture
+def _app_on_test_db(api_app, test_repository_container, _reset_overrides):
+    """Serve api_app's repositories from the test engine for one test.
+    
+    The app's own providers build them on AsyncSessionLocal, which neither
+    sees the xdist worker schema nor the test engine's connection settings.
+    """
+    import app.api.dependencies.repository_dependencies as repository_dependencies
     
-    # Override the database dependency to use test session
-    async def override_get_db():
-        yield db_session
+    for name in REPOSITORY_PROVIDERS:
+        provider = getattr(repository_dependencies, name)
+        api_app.dependency_overrides[provider] = getattr(test_repository_container, name)
+
+class UseCaseStub:
+    """Minimal stand-in for a use case: execute() returns `ret` or raises `exc`"""
     
-    app.dependency_overrides[get_db] = override_get_db
+    def __init__(self):
+        self.reset()
     
-    async with AsyncClient(app=app, base_url="http://test") as ac:
-        yield ac
+    def reset(self):
+        """Clear the configured result"""
+        self.ret = None
+        self.exc = None
     
-    # Clean up the override after the test
-    del app.dependency_overrides[get_db]
+    async def execute(self, *args, **kwargs):
+        if self.exc is not None:
+            raise self.exc
+        return self.ret
+
+# Card use-case class names mapped to their dependency providers in app.api.v1.cards
+CARD_USE_CASE_PROVIDERS = {
+    "CreateCardUseCase": "get_create_card_use_case",
+    "GetCardUseCase": "get_card_use_case",
+    "GetCardByCardIdUseCase": "get_card_by_card_id_use_case",
+    "GetUserCardsUseCase": "get_user_cards_use_case",
+    "ListCardsUseCase": "get_list_cards_use_case",
+    "UpdateCardUseCase": "get_update_card_use_case",
+    "SuspendCardUseCase": "get_suspend_card_use_case",
+    "DeactivateCardUseCase": "get_deactivate_card_use_case",
+    "DeleteCardUseCase": "get_delete_card_use_case",
+}
+
+@pytest.fixture(scope="module")
+def _patched_card_use_cases(api_app):
+    """Override every card use-case dependency once per module with a shared stub"""
+    import app.api.v1.cards as cards_module
+    
+    stubs = {name: UseCaseStub() for name in CARD_USE_CASE_PROVIDERS}
+    providers = [getattr(cards_module, provider) for provider in CARD_USE_CASE_PROVIDERS.values()]
+    for provider, stub in zip(providers, stubs.values()):
+        # Bind through a factory so FastAPI sees a parameterless override
+        api_app.dependency_overrides[provider] = (lambda _stub: lambda: _stub)(stub)
+    yield stubs
+    for provider in providers:
+        api_app.dependency_overrides.pop(provider, None)
 
 @pytest.fixture
-async def auth_service():
-    """AuthService instance for testing"""
-    return AuthService()
+def card_mocks(_patched_card_use_cases):
+    """Card use-case stubs keyed by class name, reset before each test"""
+    for stub in _patched_card_use_cases.values():
+        stub.reset()
+    return _patched_card_use_cases
+
+# Door use cases the doors API tests stub out; app.api.v1.doors builds one per request
+DOOR_USE_CASES = (
+    "GetDoorsBySecurityLevelUseCase",
+    "ListDoorsUseCase",
+    "GetActiveDoorsUseCase",
+    "UpdateDoorUseCase",
+    "SetDoorStatusUseCase",
+    "DeleteDoorUseCase",
+)
+
+@pytest.fixture(scope="module")
+def _patched_door_use_cases():
+    """Replace the stubbed door use-case classes once per module with shared stubs"""
+    import app.api.v1.doors as doors_module
+    
+    stubs = {name: UseCaseStub() for name in DOOR_USE_CASES}
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        for name, stub in stubs.items():
+            # The route constructs the use case from its repository; hand back the stub instead
+            monkeypatch.setattr(doors_module, name, (lambda _stub: lambda *args, **kwargs: _stub)(stub))
+        yield stubs
 
 @pytest.fixture
-async def admin_user(db_session: AsyncSession, auth_service: AuthService):
-    """Create admin user for authenticated requests."""
-    hashed_password = auth_service.hash_password("AdminPassword123!")
-    user_model = UserModel(
-        email="admin@test.com",
-        hashed_password=hashed_password,
-        full_name="Admin User",
-        roles=["admin"],
-        is_active=True,
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc)
-    )
-    db_session.add(user_model)
-    await db_session.commit()
-    await db_session.refresh(user_model)
-    return user_model
+def door_mocks(_patched_door_use_cases):
+    """Door use-case stubs keyed by class name, reset before each test"""
+    for stub in _patched_door_use_cases.values():
+        stub.reset()
+    return _patched_door_use_cases
+
+@pytest.fixture(scope="session")
+def auth_service():
+    """AuthService instance for testing; it holds no per-test state"""
+    return AuthService()
+
+@pytest.fixture(scope="session")
+def _admin_password_hash(auth_service: AuthService):
+    """bcrypt hash of the admin password, computed once per session"""
+    return auth_service.hash_password("AdminPassword123!")
+
+# The one admin account for DB-backed tests; admin_user adds the password hash
+ADMIN_USER_ROW = {
+    "id": SAMPLE_ADMIN_UUID,
+    "email": "admin@test.com",
+    "full_name": "Admin User",
+    "roles": ["admin"],
+    "is_active": True,
+    "created_at": FIXTURE_NOW,
+    "updated_at": FIXTURE_NOW,
+}
+
+@pytest.fixture(scope="session")
+def _kept_rows():
+    """Row ids per model that _cleanup_tables leaves in place, children first"""
+    return {PermissionModel: [], CardModel: [], DoorModel: [], UserModel: []}
+
+@asynccontextmanager
+async def keep_rows(engine, kept_rows: Dict[type, List[UUID]], rows: Dict[type, List[UUID]]):
+    """Spare `rows` from _cleanup_tables while the block runs, then delete them (children first)"""
+    for model, ids in rows.items():
+        kept_rows[model].extend(ids)
+    try:
+        yield
+    finally:
+        async with engine.begin() as conn:
+            for model, ids in rows.items():
+                kept_rows[model] = [kept for kept in kept_rows[model] if kept not in ids]
+                await conn.execute(delete(model).where(model.id.in_(ids)))
 
 @pytest.fixture
-async def auth_headers(admin_user: UserModel, auth_service: AuthService):
+async def _cleanup_tables(test_db, _kept_rows: Dict[type, List[UUID]]):
+    """Delete the rows a test committed, keeping the rows module fixtures seeded.
+    
+    It only needs the engine, so its teardown runs after the test's
+    db_session has closed and released its locks.
+    """
+    yield
+    async with test_db.begin() as conn:  # begin() commits the deletes on exit
+        for model, keep_ids in _kept_rows.items():
+            await conn.execute(delete(model).where(model.id.not_in(keep_ids)))
+
+@pytest_asyncio.fixture(scope="module")
+async def admin_user(test_db, _kept_rows, _admin_password_hash: str):
+    """Create admin user for authenticated requests once per module; deleted when the module ends."""
+    user_model = UserModel(**ADMIN_USER_ROW, hashed_password=_admin_password_hash)
+    # The id is set client-side and the session keeps attributes loaded
+    # after commit, so no refresh is needed
+    async with async_sessionmaker(test_db, expire_on_commit=False)() as session:
+        session.add(user_model)
+        await session.commit()
+    async with keep_rows(test_db, _kept_rows, {UserModel: [user_model.id]}):
+        yield user_model
+
+# Signed Authorization headers keyed by (user id, email, roles)
+_BEARER_HEADERS: Dict[Tuple[str, str, Tuple[str, ...]], Mapping[str, str]] = {}
+
+def bearer_headers(user_model: UserModel) -> Mapping[str, str]:
+    """Read-only Authorization header for a stored user, signed once per identity"""
+    key = (str(user_model.id), user_model.email, tuple(user_model.roles))
+    if key not in _BEARER_HEADERS:
+        token = AuthService().generate_access_token(UserMapper.to_domain(user_model))
+        _BEARER_HEADERS[key] = MappingProxyType({"Authorization": f"Bearer {token}"})
+    return _BEARER_HEADERS[key]
+
+@pytest.fixture(scope="module")
+def auth_headers(admin_user: UserModel):
     """Authentication headers for API requests."""
-    token_pair = auth_service.generate_token_pair(
-        user_id=str(admin_user.id),
-        email=admin_user.email,
-        roles=admin_user.roles
-    )
-    return {"Authorization": f"Bearer {token_pair.access_token}"}
+    return bearer_headers(admin_user)
 
-@pytest.fixture
-async def test_employee_user(db_session: AsyncSession):
-    """Create employee user for access testing."""
-    user_model = UserModel(
+def build_test_employee_user() -> UserModel:
+    """Unsaved employee user whose id is assigned up front so rows can reference it before a flush."""
+    return UserModel(
+        id=uuid4(),
         email="employee@test.com",
         hashed_password="hashed_password",
         full_name="Employee User",
         roles=["user"],
         is_active=True,
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc)
+        created_at=FIXTURE_NOW,
+        updated_at=FIXTURE_NOW
     )
-    db_session.add(user_model)
-    await db_session.commit()
-    await db_session.refresh(user_model)
-    return user_model
 
-@pytest.fixture
-async def test_doors(db_session: AsyncSession):
-    """Create test doors with different security levels."""
-    doors = []
-    
+def build_test_doors() -> List[DoorModel]:
+    """Unsaved doors with different security levels; ids are assigned up front."""
     # Regular office door
     office_door = DoorModel(
+        id=uuid4(),
         name="Office Door",
         location="Building A - Floor 1",
         security_level="low",
         status="active",
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc)
+        created_at=FIXTURE_NOW,
+        updated_at=FIXTURE_NOW
     )
     
     # Server room with high security
     server_door = DoorModel(
+        id=uuid4(),
         name="Server Room",
         location="Building A - Basement",
         security_level="high",
         status="active",
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc)
+        created_at=FIXTURE_NOW,
+        updated_at=FIXTURE_NOW
     )
     
     # Maintenance door
     maintenance_door = DoorModel(
+        id=uuid4(),
         name="Maintenance Room",
         location="Building A - Basement",
         security_level="medium",
         status="maintenance",
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc)
+        created_at=FIXTURE_NOW,
+        updated_at=FIXTURE_NOW
     )
     
-    doors.extend([office_door, server_door, maintenance_door])
-    
-    for door in doors:
-        db_session.add(door)
-    
-    await db_session.commit()
-    
-    for door in doors:
-        await db_session.refresh(door)
-    
-    return doors
+    return [office_door, server_door, maintenance_door]
 
-@pytest.fixture
-async def test_cards(db_session: AsyncSession, test_employee_user: UserModel):
-    """Create test cards for different scenarios."""
-    cards = []
-    
+def build_test_cards(user: UserModel) -> List[CardModel]:
+    """Unsaved cards for different scenarios, all owned by the given user."""
     # Active employee card
     active_card = CardModel(
-        user_id=test_employee_user.id,
+        user_id=user.id,
         card_id="EMP001",
         card_type="employee",
         status="active",
-        valid_from=datetime.now(timezone.utc),
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc)
+        valid_from=FIXTURE_NOW,
+        created_at=FIXTURE_NOW,
+        updated_at=FIXTURE_NOW
     )
     
     # Suspended card
     suspended_card = CardModel(
-        user_id=test_employee_user.id,
+        user_id=user.id,
         card_id="EMP002",
         card_type="employee",
         status="suspended",
-        valid_from=datetime.now(timezone.utc),
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc)
+        valid_from=FIXTURE_NOW,
+        created_at=FIXTURE_NOW,
+        updated_at=FIXTURE_NOW
     )
     
     # Master card
     master_card = CardModel(
-        user_id=test_employee_user.id,
+        user_id=user.id,
         card_id="MASTER001",
         card_type="master",
         status="active",
-        valid_from=datetime.now(timezone.utc),
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc)
+        valid_from=FIXTURE_NOW,
+        created_at=FIXTURE_NOW,
+        updated_at=FIXTURE_NOW
     )
     
-    cards.extend([active_card, suspended_card, master_card])
-    
-    for card in cards:
-        db_session.add(card)
-    
-    await db_session.commit()
-    
-    for card in cards:
-        await db_session.refresh(card)
-    
-    return cards
+    return [active_card, suspended_card, master_card]
+
+class SeededDoors(NamedTuple):
+    """Doors from build_test_doors, by role."""
+    office: DoorModel
+    server_room: DoorModel
+    maintenance: DoorModel
+
+class SeededCards(NamedTuple):
+    """Employee cards from build_test_cards, by role."""
+    active: CardModel
+    suspended: CardModel
+    master: CardModel
+
+@pytest_asyncio.fixture(scope="module")
+async def _db_seed(test_db, _kept_rows, admin_user: UserModel):
+    """Insert the employee with the test doors and cards once per module; deleted when it ends.
+    
+    The seeding session keeps attributes loaded after commit, so tests read
+    the detached rows without querying again; they must treat them as
+    read-only.
+    """
+    employee = build_test_employee_user()
+    doors = SeededDoors(*build_test_doors())
+    cards = SeededCards(*build_test_cards(employee))
+    async with async_sessionmaker(test_db, expire_on_commit=False)() as session:
+        session.add_all([employee, *doors, *cards])
+        await session.commit()
+    
+    rows = {
+        CardModel: [card.id for card in cards],
+        DoorModel: [door.id for door in doors],
+        UserModel: [employee.id],
+    }
+    async with keep_rows(test_db, _kept_rows, rows):
+        yield SimpleNamespace(admin=admin_user, employee=employee, doors=doors, cards=cards)
+
+@pytest.fixture
+def test_employee_user(_db_seed: SimpleNamespace):
+    """Module-seeded employee user."""
+    return _db_seed.employee
+
+@pytest.fixture
+def test_doors(_db_seed: SimpleNamespace):
+    """Module-seeded test doors with different security levels."""
+    return _db_seed.doors
+
+@pytest.fixture
+def test_cards(_db_seed: SimpleNamespace):
+    """Module-seeded test cards for different scenarios."""
+    return _db_seed.cards
+
+@pytest.fixture
+def test_universe(_db_seed: SimpleNamespace):
+    """Module-seeded test doors and cards as (doors, cards) named tuples."""
+    return _db_seed.doors, _db_seed.cards
 
 # Utility functions for tests
 @pytest.fixture
@@ -381,11 +660,16 @@ def sample_user():
         full_name="Test User",
         roles=[Role.USER],
         status=UserStatus.ACTIVE,
-        created_at=datetime.now(UTC),
-        updated_at=datetime.now(UTC)
+        created_at=FIXTURE_NOW,
+        updated_at=FIXTURE_NOW
     )
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def now():
+    """Frozen timestamp shared by the whole session"""
+    return SAMPLE_NOW
+
+@pytest.fixture(scope="session")
 def sample_admin_user():
     """Sample admin user for testing"""
     return User(
@@ -395,8 +679,8 @@ def sample_admin_user():
         full_name="Admin User",
         roles=[Role.ADMIN, Role.OPERATOR],
         status=UserStatus.ACTIVE,
-        created_at=datetime.now(UTC),
-        updated_at=datetime.now(UTC)
+        created_at=SAMPLE_NOW,
+        updated_at=SAMPLE_NOW
     )
 
 @pytest.fixture
@@ -404,6 +688,21 @@ def valid_jwt_token(auth_service, sample_user):
     """Valid JWT token for testing"""
     return auth_service.generate_access_token(sample_user)
 
+@pytest.fixture(scope="session")
+def admin_jwt_token(sample_admin_user):
+    """Valid JWT token for the admin user, signed once per session"""
+    return AuthService().generate_access_token(sample_admin_user)
+
+@pytest.fixture(scope="session")
+def admin_headers(admin_jwt_token):
+    """Headers with admin JWT token"""
+    return {"Authorization": f"Bearer {admin_jwt_token}"}
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_jwt(admin_jwt_token):
+    """Decode one token up front so JWT backend setup is not billed to the first test"""
+    AuthService().decode_token(admin_jwt_token)
+
 @pytest.fixture
 def valid_user_claims():
     """Valid user claims for testing"""
@@ -427,7 +726,7 @@ def admin_user_claims():
 @pytest.fixture
 def sample_card():
     """Sample card for testing"""
-    now = datetime.now(UTC)
+    now = FIXTURE_NOW
     return Card(
         id=SAMPLE_CARD_UUID,
         card_id="CARD001",
@@ -444,7 +743,7 @@ def sample_card():
 @pytest.fixture
 def sample_door():
     """Sample door for testing"""
-    now = datetime.now(UTC)
+    now = FIXTURE_NOW
     schedule = AccessSchedule(
         days_of_week=[0, 1, 2, 3, 4],
         start_time=time(9, 0),
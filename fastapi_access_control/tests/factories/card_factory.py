@@ -19,17 +19,18 @@ class CardFactory(EntityFactory):
     @classmethod
     def build(cls, **kwargs) -> Dict[str, Any]:
         """Build card attributes with sensible defaults."""
+        now = cls.current_utc_time()
         defaults = {
             'id': cls.generate_uuid('card'),
             'card_id': cls.generate_card_id('CARD'),
             'user_id': kwargs.get('user_id', cls.generate_uuid('user')),
             'card_type': CardType.STANDARD,
             'status': CardStatus.ACTIVE,
-            'valid_from': cls.current_utc_time(),
+            'valid_from': now,
             'valid_until': cls.future_time(365),  # Valid for 1 year
             'last_used': None,
-            'created_at': cls.current_utc_time(),
-            'updated_at': cls.current_utc_time()
+            'created_at': now,
+            'updated_at': now
         }
         return cls.merge_kwargs(defaults, kwargs)
     
@@ -121,17 +122,18 @@ class CardModelFactory(DatabaseFactory):
     @classmethod
     def build(cls, **kwargs) -> Dict[str, Any]:
         """Build card model attributes with sensible defaults."""
+        now = cls.current_utc_time()
         defaults = {
             'id': cls.generate_uuid('card'),
             'card_id': cls.generate_card_id('CARD'),
             'user_id': kwargs.get('user_id', cls.generate_uuid('user')),
             'card_type': 'standard',
             'status': 'active',
-            'valid_from': cls.current_utc_time(),
+            'valid_from': now,
             'valid_until': cls.future_time(365),
             'last_used': None,
-            'created_at': cls.current_utc_time(),
-            'updated_at': cls.current_utc_time()
+            'created_at': now,
+            'updated_at': now
         }
         return cls.merge_kwargs(defaults, kwargs)
     
@@ -19,6 +19,7 @@ class DoorFactory(EntityFactory):
     @classmethod
     def build(cls, **kwargs) -> Dict[str, Any]:
         """Build door attributes with sensible defaults."""
+        now = cls.current_utc_time()
         defaults = {
             'id': cls.generate_uuid('door'),
             'name': cls._generate_door_name(),
@@ -34,8 +35,8 @@ class DoorFactory(EntityFactory):
             'failed_attempts': 0,
             'locked_until': None,
             'last_access': None,
-            'created_at': cls.current_utc_time(),
-            'updated_at': cls.current_utc_time()
+            'created_at': now,
+            'updated_at': now
         }
         return cls.merge_kwargs(defaults, kwargs)
     
@@ -181,6 +182,7 @@ class DoorModelFactory(DatabaseFactory):
     @classmethod
     def build(cls, **kwargs) -> Dict[str, Any]:
         """Build door model attributes with sensible defaults."""
+        now = cls.current_utc_time()
         defaults = {
             'id': cls.generate_uuid('door'),
             'name': cls._generate_door_name(),
@@ -196,8 +198,8 @@ class DoorModelFactory(DatabaseFactory):
             'failed_attempts': 0,
             'locked_until': None,
             'last_access': None,
-            'created_at': cls.current_utc_time(),
-            'updated_at': cls.current_utc_time()
+            'created_at': now,
+            'updated_at': now
         }
         return cls.merge_kwargs(defaults, kwargs)
     
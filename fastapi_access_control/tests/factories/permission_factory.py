@@ -20,19 +20,20 @@ class PermissionFactory(EntityFactory):
     @classmethod
     def build(cls, **kwargs) -> Dict[str, Any]:
         """Build permission attributes with sensible defaults."""
+        now = cls.current_utc_time()
         defaults = {
             'id': cls.generate_uuid('permission'),
             'user_id': kwargs.get('user_id', cls.generate_uuid('user')),
             'door_id': kwargs.get('door_id', cls.generate_uuid('door')),
             'card_id': kwargs.get('card_id', None),  # Optional specific card
             'status': PermissionStatus.ACTIVE,
-            'valid_from': cls.current_utc_time(),
+            'valid_from': now,
             'valid_until': cls.future_time(365),  # Valid for 1 year
             'access_schedule': None,
             'last_used': None,
             'usage_count': 0,
-            'created_at': cls.current_utc_time(),
-            'updated_at': cls.current_utc_time()
+            'created_at': now,
+            'updated_at': now
         }
         return cls.merge_kwargs(defaults, kwargs)
     
@@ -159,19 +160,20 @@ class PermissionModelFactory(DatabaseFactory):
     @classmethod
     def build(cls, **kwargs) -> Dict[str, Any]:
         """Build permission model attributes with sensible defaults."""
+        now = cls.current_utc_time()
         defaults = {
             'id': cls.generate_uuid('permission'),
             'user_id': kwargs.get('user_id', cls.generate_uuid('user')),
             'door_id': kwargs.get('door_id', cls.generate_uuid('door')),
             'card_id': kwargs.get('card_id', None),
             'status': 'active',
-            'valid_from': cls.current_utc_time(),
+            'valid_from': now,
             'valid_until': cls.future_time(365),
             'access_schedule_data': None,
             'last_used': None,
             'usage_count': 0,
-            'created_at': cls.current_utc_time(),
-            'updated_at': cls.current_utc_time()
+            'created_at': now,
+            'updated_at': now
         }
         return cls.merge_kwargs(defaults, kwargs)
     
@@ -1,6 +1,7 @@
 """
 User factory for creating test user entities and database models.
 """
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 from uuid import UUID
 
@@ -20,6 +21,7 @@ class UserFactory(EntityFactory):
     @classmethod
     def build(cls, **kwargs) -> Dict[str, Any]:
         """Build user attributes with sensible defaults."""
+        now = cls.current_utc_time()
         defaults = {
             'id': cls.generate_uuid('user'),
             'email': cls.generate_email('user'),
@@ -27,8 +29,8 @@ class UserFactory(EntityFactory):
             'roles': [Role.USER],
             'status': UserStatus.ACTIVE,
             'last_login': None,
-            'created_at': cls.current_utc_time(),
-            'updated_at': cls.current_utc_time()
+            'created_at': now,
+            'updated_at': now
         }
         return cls.merge_kwargs(defaults, kwargs)
     
@@ -105,6 +107,7 @@ class UserModelFactory(DatabaseFactory):
     @classmethod
     def build(cls, **kwargs) -> Dict[str, Any]:
         """Build user model attributes with sensible defaults."""
+        now = cls.current_utc_time()
         defaults = {
             'id': cls.generate_uuid('user'),
             'email': cls.generate_email('user'),
@@ -113,8 +116,8 @@ class UserModelFactory(DatabaseFactory):
             'roles': ['user'],
             'is_active': True,
             'last_login': None,
-            'created_at': cls.current_utc_time(),
-            'updated_at': cls.current_utc_time()
+            'created_at': now,
+            'updated_at': now
         }
         return cls.merge_kwargs(defaults, kwargs)
     
@@ -159,8 +162,9 @@ class UserModelFactory(DatabaseFactory):
         return cls.create(**cls.merge_kwargs(specific_defaults, kwargs))
     
     @classmethod
+    @lru_cache(maxsize=None)
     def _generate_hashed_password(cls, plain_password: str = 'password123') -> str:
-        """Generate a hashed password for testing."""
+        """Generate a hashed password for testing; each plaintext is hashed once per run."""
         auth_service = AuthService()
         return auth_service.hash_password(plain_password)
 
@@ -11,35 +11,6 @@ from tests.conftest import SAMPLE_USER_UUID, SAMPLE_CARD_UUID, SAMPLE_CARD_UUID_
 class TestAccessControlFlow:
     """Integration tests for complete access control flow scenarios"""
     
-    @pytest.fixture
-    def auth_service(self):
-        """Local auth service instance"""
-        return AuthService()
-    
-    @pytest.fixture
-    def sample_admin_user(self):
-        """Sample admin user for testing"""
-        return User(
-            id=SAMPLE_ADMIN_UUID,
-            email="admin@example.com",
-            hashed_password="$2b$12$admin.hash.here",
-            full_name="Admin User",
-            roles=[Role.ADMIN, Role.OPERATOR],
-            status=UserStatus.ACTIVE,
-            created_at=datetime.now(UTC),
-            updated_at=datetime.now(UTC)
-        )
-    
-    @pytest.fixture
-    def admin_jwt_token(self, auth_service, sample_admin_user):
-        """Valid JWT token for admin user"""
-        return auth_service.generate_access_token(sample_admin_user)
-    
-    @pytest.fixture
-    def admin_headers(self, admin_jwt_token):
-        """Headers with admin JWT token"""
-        return {"Authorization": f"Bearer {admin_jwt_token}"}
-    
     @pytest.fixture
     def sync_client(self):
         """Synchronous test client for these specific tests"""
@@ -75,113 +46,93 @@ class TestAccessControlFlow:
         from app.main import app
         return TestClient(app)
     
-    def test_complete_card_management_flow(self, sync_client: TestClient, admin_headers):
+    def test_complete_card_management_flow(self, sync_client: TestClient, admin_headers, card_mocks, now):
         """Test complete card management workflow: create, read, update, suspend, delete"""
-        now = datetime.now(UTC).replace(tzinfo=None)
-        
         # Step 1: Create a new card
-        with patch('app.api.v1.cards.CreateCardUseCase') as mock_create_use_case:
-            mock_create = AsyncMock()
-            mock_create_use_case.return_value = mock_create
-            
-            created_card = Card(
-                id=SAMPLE_CARD_UUID,
-                card_id="EMPLOYEE001",
-                user_id=SAMPLE_USER_UUID,
-                card_type=CardType.EMPLOYEE,
-                status=CardStatus.ACTIVE,
-                valid_from=now,
-                valid_until=now + timedelta(days=365),
-                created_at=now,
-                updated_at=now,
-                use_count=0
-            )
-            mock_create.execute.return_value = created_card
-            
-            card_data = {
-                "card_id": "EMPLOYEE001",
-                "user_id": str(SAMPLE_USER_UUID),
-                "card_type": "employee",
-                "valid_from": now.isoformat(),
-                "valid_until": (now + timedelta(days=365)).isoformat()
-            }
-            
-            response = sync_client.post("/api/v1/cards/", json=card_data, headers=admin_headers)
-            assert response.status_code == 201
-            assert response.json()["card_id"] == "EMPLOYEE001"
+        created_card = Card(
+            id=SAMPLE_CARD_UUID,
+            card_id="EMPLOYEE001",
+            user_id=SAMPLE_USER_UUID,
+            card_type=CardType.EMPLOYEE,
+            status=CardStatus.ACTIVE,
+            valid_from=now,
+            valid_until=now + timedelta(days=365),
+            created_at=now,
+            updated_at=now,
+            use_count=0
+        )
+        card_mocks["CreateCardUseCase"].ret = created_card
+        
+        card_data = {
+            "card_id": "EMPLOYEE001",
+            "user_id": str(SAMPLE_USER_UUID),
+            "card_type": "employee",
+            "valid_from": now.isoformat(),
+            "valid_until": (now + timedelta(days=365)).isoformat()
+        }
+        
+        response = sync_client.post("/api/v1/cards/", json=card_data, headers=admin_headers)
+        assert response.status_code == 201
+        assert response.json()["card_id"] == "EMPLOYEE001"
         
         # Step 2: Retrieve the card by card_id
-        with patch('app.api.v1.cards.GetCardByCardIdUseCase') as mock_get_use_case:
-            mock_get = AsyncMock()
-            mock_get_use_case.return_value = mock_get
-            mock_get.execute.return_value = created_card
-            
-            response = sync_client.get("/api/v1/cards/by-card-id/EMPLOYEE001", headers=admin_headers)
-            assert response.status_code == 200
-            data = response.json()
-            assert data["card_id"] == "EMPLOYEE001"
-            assert data["status"] == "active"
+        card_mocks["GetCardByCardIdUseCase"].ret = created_card
+        
+        response = sync_client.get("/api/v1/cards/by-card-id/EMPLOYEE001", headers=admin_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["card_id"] == "EMPLOYEE001"
+        assert data["status"] == "active"
         
         # Step 3: Update the card to visitor type
-        with patch('app.api.v1.cards.UpdateCardUseCase') as mock_update_use_case:
-            mock_update = AsyncMock()
-            mock_update_use_case.return_value = mock_update
-            
-            updated_card = Card(
-                id=SAMPLE_CARD_UUID,
-                card_id="EMPLOYEE001",
-                user_id=SAMPLE_USER_UUID,
-                card_type=CardType.VISITOR,  # Updated
-                status=CardStatus.ACTIVE,
-                valid_from=now,
-                valid_until=now + timedelta(days=30),  # Updated
-                created_at=now,
-                updated_at=now + timedelta(minutes=5),
-                use_count=0
-            )
-            mock_update.execute.return_value = updated_card
-            
-            update_data = {
-                "card_type": "visitor",
-                "valid_until": (now + timedelta(days=30)).isoformat()
-            }
-            
-            response = sync_client.put(f"/api/v1/cards/{SAMPLE_CARD_UUID}", json=update_data, headers=admin_headers)
-            assert response.status_code == 200
-            data = response.json()
-            assert data["card_type"] == "visitor"
+        updated_card = Card(
+            id=SAMPLE_CARD_UUID,
+            card_id="EMPLOYEE001",
+            user_id=SAMPLE_USER_UUID,
+            card_type=CardType.VISITOR,  # Updated
+            status=CardStatus.ACTIVE,
+            valid_from=now,
+            valid_until=now + timedelta(days=30),  # Updated
+            created_at=now,
+            updated_at=now + timedelta(minutes=5),
+            use_count=0
+        )
+        card_mocks["UpdateCardUseCase"].ret = updated_card
+        
+        update_data = {
+            "card_type": "visitor",
+            "valid_until": (now + timedelta(days=30)).isoformat()
+        }
+        
+        response = sync_client.put(f"/api/v1/cards/{SAMPLE_CARD_UUID}", json=update_data, headers=admin_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["card_type"] == "visitor"
         
         # Step 4: Suspend the card
-        with patch('app.api.v1.cards.SuspendCardUseCase') as mock_suspend_use_case:
-            mock_suspend = AsyncMock()
-            mock_suspend_use_case.return_value = mock_suspend
-            
-            suspended_card = Card(
-                id=SAMPLE_CARD_UUID,
-                card_id="EMPLOYEE001",
-                user_id=SAMPLE_USER_UUID,
-                card_type=CardType.VISITOR,
-                status=CardStatus.SUSPENDED,  # Updated
-                valid_from=now,
-                valid_until=now + timedelta(days=30),
-                created_at=now,
-                updated_at=now + timedelta(minutes=10),
-                use_count=0
-            )
-            mock_suspend.execute.return_value = suspended_card
-            
-            response = sync_client.post(f"/api/v1/cards/{SAMPLE_CARD_UUID}/suspend", headers=admin_headers)
-            assert response.status_code == 200
-            assert response.json()["status"] == "suspended"
+        suspended_card = Card(
+            id=SAMPLE_CARD_UUID,
+            card_id="EMPLOYEE001",
+            user_id=SAMPLE_USER_UUID,
+            card_type=CardType.VISITOR,
+            status=CardStatus.SUSPENDED,  # Updated
+            valid_from=now,
+            valid_until=now + timedelta(days=30),
+            created_at=now,
+            updated_at=now + timedelta(minutes=10),
+            use_count=0
+        )
+        card_mocks["SuspendCardUseCase"].ret = suspended_card
+        
+        response = sync_client.post(f"/api/v1/cards/{SAMPLE_CARD_UUID}/suspend", headers=admin_headers)
+        assert response.status_code == 200
+        assert response.json()["status"] == "suspended"
         
         # Step 5: Delete the card
-        with patch('app.api.v1.cards.DeleteCardUseCase') as mock_delete_use_case:
-            mock_delete = AsyncMock()
-            mock_delete_use_case.return_value = mock_delete
-            mock_delete.execute.return_value = True
-            
-            response = sync_client.delete(f"/api/v1/cards/{SAMPLE_CARD_UUID}", headers=admin_headers)
-            assert response.status_code == 204
+        card_mocks["DeleteCardUseCase"].ret = True
+        
+        response = sync_client.delete(f"/api/v1/cards/{SAMPLE_CARD_UUID}", headers=admin_headers)
+        assert response.status_code == 204
     
     def test_complete_door_management_flow(self, sync_client: TestClient, admin_headers):
         """Test complete door management workflow: create, read, update status, delete"""
@@ -334,118 +285,101 @@ class TestAccessControlFlow:
             response = sync_client.delete(f"/api/v1/doors/{SAMPLE_DOOR_UUID}", headers=admin_headers)
             assert response.status_code == 204
     
-    def test_user_card_association_flow(self, sync_client: TestClient, admin_headers):
+    def test_user_card_association_flow(self, sync_client: TestClient, admin_headers, card_mocks, now):
         """Test flow of associating multiple cards with a user"""
-        now = datetime.now(UTC).replace(tzinfo=None)
-        
         # Step 1: Create primary employee card
-        with patch('app.api.v1.cards.CreateCardUseCase') as mock_create_use_case:
-            mock_create = AsyncMock()
-            mock_create_use_case.return_value = mock_create
-            
-            primary_card = Card(
-                id=SAMPLE_CARD_UUID,
-                card_id="EMP001_PRIMARY",
-                user_id=SAMPLE_USER_UUID,
-                card_type=CardType.EMPLOYEE,
-                status=CardStatus.ACTIVE,
-                valid_from=now,
-                valid_until=None,  # Permanent card
-                created_at=now,
-                updated_at=now,
-                use_count=0
-            )
-            mock_create.execute.return_value = primary_card
-            
-            card_data = {
-                "card_id": "EMP001_PRIMARY",
-                "user_id": str(SAMPLE_USER_UUID),
-                "card_type": "employee",
-                "valid_from": now.isoformat()
-            }
-            
-            response = sync_client.post("/api/v1/cards/", json=card_data, headers=admin_headers)
-            assert response.status_code == 201
+        primary_card = Card(
+            id=SAMPLE_CARD_UUID,
+            card_id="EMP001_PRIMARY",
+            user_id=SAMPLE_USER_UUID,
+            card_type=CardType.EMPLOYEE,
+            status=CardStatus.ACTIVE,
+            valid_from=now,
+            valid_until=None,  # Permanent card
+            created_at=now,
+            updated_at=now,
+            use_count=0
+        )
+        card_mocks["CreateCardUseCase"].ret = primary_card
+        
+        card_data = {
+            "card_id": "EMP001_PRIMARY",
+            "user_id": str(SAMPLE_USER_UUID),
+            "card_type": "employee",
+            "valid_from": now.isoformat()
+        }
+        
+        response = sync_client.post("/api/v1/cards/", json=card_data, headers=admin_headers)
+        assert response.status_code == 201
         
         # Step 2: Create backup card for same user
-        with patch('app.api.v1.cards.CreateCardUseCase') as mock_create_use_case2:
-            mock_create2 = AsyncMock()
-            mock_create_use_case2.return_value = mock_create2
-            
-            backup_card = Card(
-                id=SAMPLE_CARD_UUID_2,
-                card_id="EMP001_BACKUP",
-                user_id=SAMPLE_USER_UUID,
-                card_type=CardType.EMPLOYEE,
-                status=CardStatus.INACTIVE,  # Backup card starts inactive
-                valid_from=now,
-                valid_until=None,
-                created_at=now,
-                updated_at=now,
-                use_count=0
-            )
-            mock_create2.execute.return_value = backup_card
-            
-            backup_data = {
-                "card_id": "EMP001_BACKUP",
-                "user_id": str(SAMPLE_USER_UUID),
-                "card_type": "employee",
-                "valid_from": now.isoformat()
-            }
-            
-            response = sync_client.post("/api/v1/cards/", json=backup_data, headers=admin_headers)
-            assert response.status_code == 201
+        backup_card = Card(
+            id=SAMPLE_CARD_UUID_2,
+            card_id="EMP001_BACKUP",
+            user_id=SAMPLE_USER_UUID,
+            card_type=CardType.EMPLOYEE,
+            status=CardStatus.INACTIVE,  # Backup card starts inactive
+            valid_from=now,
+            valid_until=None,
+            created_at=now,
+            updated_at=now,
+            use_count=0
+        )
+        card_mocks["CreateCardUseCase"].ret = backup_card
+        
+        backup_data = {
+            "card_id": "EMP001_BACKUP",
+            "user_id": str(SAMPLE_USER_UUID),
+            "card_type": "employee",
+            "valid_from": now.isoformat()
+        }
+        
+        response = sync_client.post("/api/v1/cards/", json=backup_data, headers=admin_headers)
+        assert response.status_code == 201
         
         # Step 3: Create temporary visitor card for same user
-        with patch('app.api.v1.cards.CreateCardUseCase') as mock_create_use_case3:
-            mock_create3 = AsyncMock()
-            mock_create_use_case3.return_value = mock_create3
-            
-            temp_card = Card(
-                id=SAMPLE_CARD_UUID_2,
-                card_id="VISITOR_TEMP_001",
-                user_id=SAMPLE_USER_UUID,
-                card_type=CardType.TEMPORARY,
-                status=CardStatus.ACTIVE,
-                valid_from=now,
-                valid_until=now + timedelta(hours=8),  # 8-hour access
-                created_at=now,
-                updated_at=now,
-                use_count=0
-            )
-            mock_create3.execute.return_value = temp_card
-            
-            temp_data = {
-                "card_id": "VISITOR_TEMP_001",
-                "user_id": str(SAMPLE_USER_UUID),
-                "card_type": "temporary",
-                "valid_from": now.isoformat(),
-                "valid_until": (now + timedelta(hours=8)).isoformat()
-            }
-            
-            response = sync_client.post("/api/v1/cards/", json=temp_data, headers=admin_headers)
-            assert response.status_code == 201
+        temp_card = Card(
+            id=SAMPLE_CARD_UUID_2,
+            card_id="VISITOR_TEMP_001",
+            user_id=SAMPLE_USER_UUID,
+            card_type=CardType.TEMPORARY,
+            status=CardStatus.ACTIVE,
+            valid_from=now,
+            valid_until=now + timedelta(hours=8),  # 8-hour access
+            created_at=now,
+            updated_at=now,
+            use_count=0
+        )
+        card_mocks["CreateCardUseCase"].ret = temp_card
+        
+        temp_data = {
+            "card_id": "VISITOR_TEMP_001",
+            "user_id": str(SAMPLE_USER_UUID),
+            "card_type": "temporary",
+            "valid_from": now.isoformat(),
+            "valid_until": (now + timedelta(hours=8)).isoformat()
+        }
+        
+        response = sync_client.post("/api/v1/cards/", json=temp_data, headers=admin_headers)
+        assert response.status_code == 201
         
         # Step 4: Get all cards for the user
-        with patch('app.api.v1.cards.GetUserCardsUseCase') as mock_get_user_cards:
-            mock_get = AsyncMock()
-            mock_get_user_cards.return_value = mock_get
-            mock_get.execute.return_value = [primary_card, backup_card, temp_card]
-            
-            response = sync_client.get(f"/api/v1/cards/user/{SAMPLE_USER_UUID}", headers=admin_headers)
-            assert response.status_code == 200
-            data = response.json()
-            assert len(data) == 3
-            
-            # Verify card types
-            card_types = [card["card_type"] for card in data]
-            assert "employee" in card_types
-            assert "temporary" in card_types
-            
-            # Verify statuses
-            card_statuses = [card["status"] for card in data]
-            assert "active" in card_statuses
-            assert "inactive" in card_statuses
+        card_mocks["GetUserCardsUseCase"].ret = [primary_card, backup_card, temp_card]
+        
+        response = sync_client.get(f"/api/v1/cards/user/{SAMPLE_USER_UUID}", headers=admin_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 3
+        
+        # Verify card types
+        card_types = [card["card_type"] for card in data]
+        assert "employee" in card_types
+        assert "temporary" in card_types
+        
+        # Verify statuses
+        card_statuses = [card["status"] for card in data]
+        assert "active" in card_statuses
+        assert "inactive" in card_statuses
     
     def test_door_location_filtering_flow(self, sync_client: TestClient, admin_headers):
         """Test flow of filtering doors by location and security level"""
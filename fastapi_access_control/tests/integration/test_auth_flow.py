@@ -96,19 +96,14 @@ class TestAuthenticationFlow:
         })
         assert response.status_code == 422
     
-    def test_unauthorized_access(self, client):
-        """Test accessing protected endpoints without token"""
-        
-        # Test doors endpoint without token (it requires authentication)
-        response = client.get("/api/v1/doors/")
-        assert response.status_code == 401  # Unauthorized
-        
-        # Test with invalid token
-        response = client.get(
-            "/api/v1/doors/",
-            headers={"Authorization": "Bearer invalid-token"}
-        )
-        assert response.status_code == 401
+    @pytest.mark.parametrize("headers,expected_status", [
+        ({}, 401),  # No token (doors endpoint requires authentication)
+        ({"Authorization": "Bearer invalid-token"}, 401),  # Invalid token
+    ], ids=["no_token", "invalid_token"])
+    def test_unauthorized_access(self, client, headers, expected_status):
+        """Test accessing protected endpoints without a valid token"""
+        response = client.get("/api/v1/doors/", headers=headers)
+        assert response.status_code == expected_status
     
     def test_token_refresh_flow(self, client):
         """Test token refresh functionality"""
@@ -157,36 +152,29 @@ class TestAuthenticationFlow:
             # Clean up dependency overrides
             client.app.dependency_overrides.clear()
 
-class TestRoleBasedAccess:
-    """Tests for role-based access control"""
+def test_role_based_access_patterns():
+    """Test role-based access control patterns"""
     
-    @pytest.fixture
-    def client(self):
-        return TestClient(app)
+    # Test admin user
+    admin_claims = UserClaims(
+        user_id=SAMPLE_USER_UUID,
+        email="admin@example.com",
+        full_name="Admin User",
+        roles=["admin", "operator"]
+    )
     
-    def test_role_based_access_patterns(self):
-        """Test role-based access control patterns"""
-        
-        # Test admin user
-        admin_claims = UserClaims(
-            user_id=SAMPLE_USER_UUID,
-            email="admin@example.com",
-            full_name="Admin User",
-            roles=["admin", "operator"]
-        )
-        
-        assert admin_claims.has_role("admin")
-        assert admin_claims.has_any_role(["admin"])
-        assert admin_claims.has_any_role(["admin", "operator"])
-        
-        # Test regular user
-        user_claims = UserClaims(
-            user_id=SAMPLE_USER_UUID,
-            email="user@example.com",
-            full_name="Regular User",
-            roles=["user"]
-        )
-        
-        assert not user_claims.has_role("admin")
-        assert user_claims.has_role("user")
-        assert not user_claims.has_any_role(["admin", "operator"]) 
\ No newline at end of file
+    assert admin_claims.has_role("admin")
+    assert admin_claims.has_any_role(["admin"])
+    assert admin_claims.has_any_role(["admin", "operator"])
+    
+    # Test regular user
+    user_claims = UserClaims(
+        user_id=SAMPLE_USER_UUID,
+        email="user@example.com",
+        full_name="Regular User",
+        roles=["user"]
+    )
+    
+    assert not user_claims.has_role("admin")
+    assert user_claims.has_role("user")
+    assert not user_claims.has_any_role(["admin", "operator"]) 
\ No newline at end of file
@@ -2,89 +2,123 @@
 Complete integration tests for access control flow.
 Tests the entire system from API to database with real data.
 """
+import asyncio
+import orjson
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
-from datetime import datetime, timezone, time
-import json
-from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from datetime import time
+from types import MappingProxyType, SimpleNamespace
 
 from app.main import app
 from tests.conftest import (
-    SAMPLE_USER_UUID, SAMPLE_CARD_UUID, SAMPLE_DOOR_UUID
+    FIXTURE_NOW, MockMQTTClient, SeededCards, SeededDoors, keep_rows, bearer_headers
 )
 from tests.seeders.integration_seeder import IntegrationSeeder
+from tests.test_helpers import assert_json
 from app.infrastructure.database.models.user import UserModel
 from app.infrastructure.database.models.card import CardModel
 from app.infrastructure.database.models.door import DoorModel
 from app.infrastructure.database.models.permission import PermissionModel
-from app.domain.services.auth_service import AuthService
-from tests.conftest import MockMQTTClient
 
-pytestmark = pytest.mark.asyncio
+pytestmark = pytest.mark.usefixtures("_cleanup_tables")
 
-@pytest.fixture
-async def client(db_session):
-    """HTTP client for testing with database dependency override."""
-    from app.shared.database.session import get_db
-    
-    # Override the database dependency to use test session
-    async def override_get_db():
-        yield db_session
-    
-    app.dependency_overrides[get_db] = override_get_db
+JSON_HEADERS = {"content-type": "application/json"}
+
+# Request bodies that do not depend on seeded rows, serialized once at import
+_NEW_CARD_BYTES = orjson.dumps({"card_id": "TEST001", "card_type": "employee", "status": "active"})
+_NEW_DOOR_BYTES = orjson.dumps({"name": "Test Door", "location": "Test Location", "security_level": "medium"})
+
+# Fan-out for the concurrent access validation test
+CONCURRENT_REQUESTS = 50
+
+@pytest_asyncio.fixture(scope="module")
+async def _flow_seed(test_db, _kept_rows):
+    """Insert the IntegrationSeeder flow data once per module, on first use.
     
-    async with AsyncClient(app=app, base_url="http://test") as ac:
-        yield ac
+    Kept apart from _db_seed so only the tests that read it depend on the seeder.
+    """
+    async with async_sessionmaker(test_db, expire_on_commit=False)() as session:
+        flow = await IntegrationSeeder(session).seed_complete_access_flow_data()
     
-    # Clean up the override after the test
-    del app.dependency_overrides[get_db]
+    rows = {
+        PermissionModel: [permission.id for permission in flow["permissions"]],
+        CardModel: [card.id for card in flow["cards"].values()],
+        DoorModel: [door.id for door in flow["doors"].values()],
+        UserModel: [flow["admin_user"].id, flow["regular_user"].id],
+    }
+    async with keep_rows(test_db, _kept_rows, rows):
+        yield flow
+
+@pytest.fixture(scope="module", autouse=True)
+def _warm_openapi():
+    """Build the OpenAPI schema once; FastAPI caches it on app.openapi_schema for /openapi.json"""
+    app.openapi()
+    assert app.openapi_schema is not None
 
 @pytest.fixture
-async def auth_service():
-    """Auth service for token generation."""
-    return AuthService()
+def client(aclient: AsyncClient, _app_on_test_db):
+    """Session-wide HTTP client whose repositories use the test engine for this test."""
+    return aclient
+
+@pytest.fixture(scope="session")
+def _mqtt_recorder():
+    """Mock MQTT client created already connected, shared by the session."""
+    return MockMQTTClient(connected=True)
 
 @pytest.fixture
-async def mqtt_client_connected():
-    """Provide connected mock MQTT client."""
-    client = MockMQTTClient()
-    await client.connect()
-    return client
+def mqtt_client_connected(_mqtt_recorder: MockMQTTClient):
+    """Provide connected mock MQTT client with no messages recorded yet."""
+    _mqtt_recorder.clear_published_messages()
+    _mqtt_recorder.subscribed_topics.clear()
+    return _mqtt_recorder
+
+@pytest.fixture(scope="module")
+def auth_headers(admin_user: UserModel):
+    """Read-only authentication headers for JSON API requests, signed once per module."""
+    return MappingProxyType({**JSON_HEADERS, **bearer_headers(admin_user)})
 
 @pytest.fixture
-async def admin_user(db_session: AsyncSession, auth_service: AuthService):
-    """Create admin user for authenticated requests."""
-    hashed_password = auth_service.hash_password("AdminPassword123!")
-    user_model = UserModel(
-        email="admin@test.com",
-        hashed_password=hashed_password,
-        full_name="Admin User",
-        roles=["admin"],
+async def full_access_scenario(
+    db_session: AsyncSession,
+    admin_user: UserModel,
+    test_employee_user: UserModel,
+    test_universe: tuple[SeededDoors, SeededCards]
+):
+    """Seeded employee, doors and cards plus a weekday office-hours permission.
+    
+    Only the permission is new, so the scenario costs a single commit.
+    """
+    doors, cards = test_universe
+    permission = PermissionModel(
+        user_id=test_employee_user.id,
+        door_id=doors.office.id,
+        card_number=cards.active.card_id,
+        status="active",
+        valid_from=time(8, 0),
+        valid_until=time(18, 0),
+        days_of_week=["mon", "tue", "wed", "thu", "fri"],
         is_active=True,
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc)
+        created_at=FIXTURE_NOW,
+        updated_at=FIXTURE_NOW
     )
-    db_session.add(user_model)
+    db_session.add(permission)
     await db_session.commit()
-    await db_session.refresh(user_model)
-    return user_model
-
-@pytest.fixture
-async def auth_headers(admin_user, auth_service: AuthService):
-    """Authentication headers for API requests."""
-    token_pair = auth_service.generate_token_pair(
-        user_id=str(admin_user.id),
-        email=admin_user.email,
-        roles=admin_user.roles
+    return SimpleNamespace(
+        admin=admin_user, employee=test_employee_user, doors=doors, cards=cards, permission=permission
     )
-    return {"Authorization": f"Bearer {token_pair.access_token}"}
 
 @pytest.fixture
-async def test_data(db_session: AsyncSession):
-    """Create comprehensive test data using IntegrationSeeder."""
-    seeder = IntegrationSeeder(db_session)
-    return await seeder.seed_complete_access_flow_data()
+def test_data(_flow_seed: dict):
+    """Module-seeded IntegrationSeeder flow data, in containers the test may change freely."""
+    flow = _flow_seed
+    return {
+        **flow,
+        'doors': dict(flow['doors']),
+        'cards': dict(flow['cards']),
+        'permissions': list(flow['permissions'])
+    }
 
 class TestCompleteAccessFlow:
     """Integration tests for complete access control workflow."""
@@ -108,116 +142,63 @@ class TestCompleteAccessFlow:
         # Test access validation using seeded data
         response = await client.post(
             "/api/v1/access/validate",
-            json={"card_id": user_card.card_id, "door_id": str(office_door.id)}
+            headers=JSON_HEADERS,
+            content=orjson.dumps({"card_id": user_card.card_id, "door_id": str(office_door.id)})
         )
         
-        assert response.status_code == 200
-        data = response.json()
-        assert data["access_granted"] is True
-        assert data["door_name"] == office_door.name
-        assert data["user_name"] == user.full_name
+        data = assert_json(
+            response, 200,
+            access_granted=True, door_name=office_door.name, user_name=user.full_name
+        )
         assert "Access granted" in data["reason"]
         
         # Verify MQTT message was published
         mqtt_client_connected.assert_topic_published(f"access/doors/{office_door.id}/events")
 
-    async def test_master_card_access_flow(
-        self,
-        client: AsyncClient,
-        test_doors: list[DoorModel],
-        test_cards: list[CardModel],
-        mqtt_client_connected
-    ):
-        """Test master card access to any door."""
-        doors = test_doors
-        cards = test_cards
-        
-        server_door = doors[1]  # High security server room
-        master_card = cards[2]  # Master card
-        
-        # Master card should have access without explicit permission
-        response = await client.post(
-            "/api/v1/access/validate",
-            json={"card_id": master_card.card_id, "door_id": str(server_door.id)}
-        )
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data["access_granted"] is True
-        assert data["card_type"] == "master"
-        assert "Master card access granted" in data["reason"]
-        
-        # Verify MQTT message was published
-        mqtt_client_connected.assert_topic_published(f"access/doors/{server_door.id}/events")
-
-    async def test_suspended_card_access_denied(
+    @pytest.mark.parametrize(
+        "card_role,door_role,expected_status,expected_granted,expected_reason",
+        [
+            # Master card opens the high security server room without explicit permission
+            pytest.param("master", "server_room", 200, True, "Master card access granted", id="master_card"),
+            # Suspended card on the office door
+            pytest.param("suspended", "office", 403, False, "Card is suspended", id="suspended_card"),
+            # Active card on the maintenance door
+            pytest.param("active", "maintenance", 403, False, "Door is under maintenance", id="maintenance_door"),
+            # Active card on the server room, with no permission for it
+            pytest.param("active", "server_room", 403, False, "No permission", id="no_permission"),
+        ],
+    )
+    async def test_access_decision(
         self,
         client: AsyncClient,
-        test_doors: list[DoorModel],
-        test_cards: list[CardModel]
+        test_universe: tuple[SeededDoors, SeededCards],
+        mqtt_client_connected,
+        card_role: str,
+        door_role: str,
+        expected_status: int,
+        expected_granted: bool,
+        expected_reason: str
     ):
-        """Test that suspended cards are denied access."""
-        doors = test_doors
-        cards = test_cards
-        
-        office_door = doors[0]  # Office door
-        suspended_card = cards[1]  # Suspended card
+        """Test the access decision for each card and door state."""
+        doors, cards = test_universe
+        card = getattr(cards, card_role)
+        door = getattr(doors, door_role)
         
         response = await client.post(
             "/api/v1/access/validate",
-            json={"card_id": suspended_card.card_id, "door_id": str(office_door.id)}
+            headers=JSON_HEADERS,
+            content=orjson.dumps({"card_id": card.card_id, "door_id": str(door.id)})
         )
         
-        assert response.status_code == 403
-        data = response.json()
-        assert data["access_granted"] is False
-        assert "Card is suspended" in data["reason"]
-
-    async def test_maintenance_door_access_denied(
-        self,
-        client: AsyncClient,
-        test_doors: list[DoorModel],
-        test_cards: list[CardModel]
-    ):
-        """Test that maintenance doors deny all access."""
-        doors = test_doors
-        cards = test_cards
-        
-        maintenance_door = doors[2]  # Maintenance door
-        active_card = cards[0]  # Active card
-        
-        response = await client.post(
-            "/api/v1/access/validate",
-            json={"card_id": active_card.card_id, "door_id": str(maintenance_door.id)}
+        data = assert_json(
+            response, expected_status,
+            access_granted=expected_granted, card_type=card.card_type
         )
+        assert expected_reason in data["reason"]
         
-        assert response.status_code == 403
-        data = response.json()
-        assert data["access_granted"] is False
-        assert "Door is under maintenance" in data["reason"]
-
-    async def test_no_permission_access_denied(
-        self,
-        client: AsyncClient,
-        test_doors: list[DoorModel],
-        test_cards: list[CardModel]
-    ):
-        """Test that users without permission are denied access."""
-        doors = test_doors
-        cards = test_cards
-        
-        server_door = doors[1]  # High security server room
-        active_card = cards[0]  # Active card
-        
-        response = await client.post(
-            "/api/v1/access/validate",
-            json={"card_id": active_card.card_id, "door_id": str(server_door.id)}
-        )
-        
-        assert response.status_code == 403
-        data = response.json()
-        assert data["access_granted"] is False
-        assert "No permission" in data["reason"]
+        if expected_granted:
+            # Verify MQTT message was published
+            mqtt_client_connected.assert_topic_published(f"access/doors/{door.id}/events")
 
     async def test_card_management_integration(
         self,
@@ -241,24 +222,11 @@ class TestCompleteAccessFlow:
         response = await client.post(
             "/api/v1/cards",
             headers=headers,
-            json=new_card_data
+            content=orjson.dumps(new_card_data)
         )
         
-        assert response.status_code == 201
-        data = response.json()
-        assert data["card_id"] == "NEW001"
-        assert data["status"] == "active"
-        
-        # Get card details
-        response = await client.get(
-            f"/api/v1/cards/{data['id']}",
-            headers=headers
-        )
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data["card_id"] == "NEW001"
-        assert data["user_id"] == str(employee_user.id)
+        # The create response is the full card resource, so no follow-up GET is needed
+        assert_json(response, 201, card_id="NEW001", status="active", user_id=str(employee_user.id))
 
     async def test_door_management_integration(
         self,
@@ -279,13 +247,10 @@ class TestCompleteAccessFlow:
         response = await client.post(
             "/api/v1/doors",
             headers=headers,
-            json=new_door_data
+            content=orjson.dumps(new_door_data)
         )
         
-        assert response.status_code == 201
-        data = response.json()
-        assert data["name"] == "Test Door"
-        assert data["security_level"] == "medium"
+        data = assert_json(response, 201, name="Test Door", security_level="medium")
         
         # Get door details
         response = await client.get(
@@ -293,10 +258,7 @@ class TestCompleteAccessFlow:
             headers=headers
         )
         
-        assert response.status_code == 200
-        data = response.json()
-        assert data["name"] == "Test Door"
-        assert data["location"] == "Test Location"
+        assert_json(response, 200, name="Test Door", location="Test Location")
 
     async def test_authentication_required_for_management(
         self,
@@ -306,11 +268,8 @@ class TestCompleteAccessFlow:
         # Try to create a card without auth
         response = await client.post(
             "/api/v1/cards",
-            json={
-                "card_id": "TEST001",
-                "card_type": "employee",
-                "status": "active"
-            }
+            headers=JSON_HEADERS,
+            content=_NEW_CARD_BYTES
         )
         
         assert response.status_code == 401
@@ -318,113 +277,88 @@ class TestCompleteAccessFlow:
         # Try to create a door without auth
         response = await client.post(
             "/api/v1/doors",
-            json={
-                "name": "Test Door",
-                "location": "Test Location",
-                "security_level": "medium"
-            }
+            headers=JSON_HEADERS,
+            content=_NEW_DOOR_BYTES
         )
         
         assert response.status_code == 401
 
-    async def test_invalid_data_validation(
-        self,
-        client: AsyncClient,
-        auth_headers: dict
-    ):
-        """Test validation of invalid data."""
-        headers = auth_headers
-        
-        # Invalid card data
-        response = await client.post(
+    @pytest.mark.parametrize("endpoint,body", [
+        pytest.param(
             "/api/v1/cards",
-            headers=headers,
-            json={
+            orjson.dumps({
                 "card_id": "",  # Invalid empty card_id
                 "card_type": "invalid_type",  # Invalid card type
                 "status": "invalid_status"  # Invalid status
-            }
-        )
-        
-        assert response.status_code == 422
-        
-        # Invalid door data
-        response = await client.post(
+            }),
+            id="card",
+        ),
+        pytest.param(
             "/api/v1/doors",
-            headers=headers,
-            json={
+            orjson.dumps({
                 "name": "",  # Invalid empty name
                 "security_level": "invalid_level",  # Invalid security level
                 "status": "invalid_status"  # Invalid status
-            }
-        )
-        
+            }),
+            id="door",
+        ),
+    ])
+    async def test_invalid_data_validation(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        endpoint: str,
+        body: bytes
+    ):
+        """Test validation of invalid data."""
+        response = await client.post(endpoint, headers=auth_headers, content=body)
+
         assert response.status_code == 422
 
     async def test_concurrent_access_validation(
         self,
         client: AsyncClient,
-        db_session: AsyncSession,
-        test_employee_user: UserModel,
-        test_doors: list[DoorModel],
-        test_cards: list[CardModel]
+        full_access_scenario: SimpleNamespace
     ):
         """Test concurrent access validation requests."""
-        import asyncio
-        employee_user = test_employee_user
-        doors = test_doors
-        cards = test_cards
-        
-        office_door = doors[0]
-        active_card = cards[0]
+        office_door = full_access_scenario.doors.office
+        active_card = full_access_scenario.cards.active
         
-        # Create permission
-        permission = PermissionModel(
-            user_id=employee_user.id,
-            door_id=office_door.id,
-            card_number=active_card.card_id,
-            status="active",
-            valid_from=time(8, 0),
-            valid_until=time(18, 0),
-            days_of_week=["mon", "tue", "wed", "thu", "fri"],
-            is_active=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-        db_session.add(permission)
-        await db_session.commit()
+        # Every request sends the same body, so serialize it once
+        body = orjson.dumps({"card_id": active_card.card_id, "door_id": str(office_door.id)})
         
-        # Make concurrent requests
-        async def make_request():
-            return await client.post(
+        # Assert inside each task so the TaskGroup cancels the rest on the first failure
+        async def validate_once():
+            response = await client.post(
                 "/api/v1/access/validate",
-                json={"card_id": active_card.card_id, "door_id": str(office_door.id)}
+                headers=JSON_HEADERS,
+                content=body
             )
+            assert_json(response, 200, access_granted=True)
         
-        # Make 5 concurrent requests
-        responses = await asyncio.gather(*[make_request() for _ in range(5)])
+        # One request up front primes the route's validators and SQLAlchemy's
+        # compiled statement cache outside the concurrent window
+        await validate_once()
         
-        # All requests should succeed
-        for response in responses:
-            assert response.status_code == 200
-            data = response.json()
-            assert data["access_granted"] is True
+        async with asyncio.TaskGroup() as requests:
+            for _ in range(CONCURRENT_REQUESTS):
+                requests.create_task(validate_once())
 
     async def test_health_and_metrics_endpoints(
         self,
         client: AsyncClient
     ):
         """Test health check and metrics endpoints."""
+        # Read-only endpoints, so both requests can be in flight together
+        health_response, metrics_response = await asyncio.gather(
+            client.get("/health"), client.get("/metrics")
+        )
+        
         # Health check
-        response = await client.get("/health")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "healthy"
+        assert_json(health_response, 200, status="healthy")
         
         # Metrics
-        response = await client.get("/metrics")
-        assert response.status_code == 200
-        data = response.json()
+        data = assert_json(metrics_response, 200)
         assert "total_requests" in data
         assert "successful_requests" in data
         assert "failed_requests" in data
@@ -434,15 +368,16 @@ class TestCompleteAccessFlow:
         client: AsyncClient
     ):
         """Test API documentation endpoints."""
+        openapi_response, docs_response = await asyncio.gather(
+            client.get("/openapi.json"), client.get("/docs")
+        )
+        
         # OpenAPI JSON
-        response = await client.get("/openapi.json")
-        assert response.status_code == 200
-        data = response.json()
+        data = assert_json(openapi_response, 200)
         assert "openapi" in data
         assert "info" in data
         assert "paths" in data
         
         # Swagger UI
-        response = await client.get("/docs")
-        assert response.status_code == 200
-        assert "text/html" in response.headers["content-type"]
\ No newline at end of file
+        assert docs_response.status_code == 200
+        assert "text/html" in docs_response.headers["content-type"]
\ No newline at end of file
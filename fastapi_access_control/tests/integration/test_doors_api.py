@@ -1,21 +1,21 @@
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock
 from datetime import datetime, timezone, UTC, timedelta, time
 from app.domain.entities.door import Door, DoorType, SecurityLevel, DoorStatus, AccessSchedule
 from app.domain.entities.user import User, Role, UserStatus
-from tests.conftest import SAMPLE_DOOR_UUID, SAMPLE_DOOR_UUID_2, SAMPLE_ADMIN_UUID
+from tests.conftest import SAMPLE_DOOR_UUID, SAMPLE_DOOR_UUID_2, SAMPLE_ADMIN_UUID, SAMPLE_NOW
 
 class TestDoorsAPI:
     """Integration tests for Doors API endpoints"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def client(self):
-        """HTTP client for testing."""
+        """HTTP client shared by the class; the app lifespan is not run and tests override dependencies."""
         from app.main import app
         return TestClient(app)
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_admin_user(self):
         """Mock admin user for testing."""
         return User(
@@ -25,30 +25,27 @@ class TestDoorsAPI:
             full_name="Admin User",
             roles=[Role.ADMIN],
             status=UserStatus.ACTIVE,
-            created_at=datetime.now(UTC),
-            updated_at=datetime.now(UTC)
+            created_at=SAMPLE_NOW,
+            updated_at=SAMPLE_NOW
         )
     
-    def setup_auth_override(self, client, user):
-        """Helper to setup authentication override."""
+    @pytest.fixture(autouse=True)
+    def _as_admin(self, client, mock_admin_user):
+        """Authenticate every request in this class as the admin user."""
         from app.api.dependencies.auth_dependencies import get_current_active_user
-        client.app.dependency_overrides[get_current_active_user] = lambda: user
-        
-    def cleanup_overrides(self, client):
-        """Helper to cleanup dependency overrides."""
-        client.app.dependency_overrides.clear()
+        client.app.dependency_overrides[get_current_active_user] = lambda: mock_admin_user
+        yield
+        client.app.dependency_overrides.pop(get_current_active_user, None)
     
-    def test_create_door_success(self, client, mock_admin_user):
+    def test_create_door_success(self, client):
         """Test successful door creation"""
         # Create mocks
         mock_door_repository = AsyncMock()
         
         # Use FastAPI dependency override system
         from app.api.v1.doors import get_door_repository
-        from app.api.dependencies.auth_dependencies import get_current_active_user
         
         client.app.dependency_overrides[get_door_repository] = lambda: mock_door_repository
-        client.app.dependency_overrides[get_current_active_user] = lambda: mock_admin_user
         
         try:
             # Mock successful door creation
@@ -108,20 +105,18 @@ class TestDoorsAPI:
             assert data["status"] == "active"
             
         finally:
-            # Clean up dependency overrides
-            client.app.dependency_overrides.clear()
+            # Drop only the repository override; _as_admin removes its own
+            client.app.dependency_overrides.pop(get_door_repository, None)
 
-    def test_create_door_without_schedule(self, client, mock_admin_user):
+    def test_create_door_without_schedule(self, client):
         """Test door creation without default schedule"""
         # Create mocks
         mock_door_repository = AsyncMock()
         
         # Use FastAPI dependency override system
         from app.api.v1.doors import get_door_repository
-        from app.api.dependencies.auth_dependencies import get_current_active_user
         
         client.app.dependency_overrides[get_door_repository] = lambda: mock_door_repository
-        client.app.dependency_overrides[get_current_active_user] = lambda: mock_admin_user
         
         try:
             # Mock successful door creation without schedule
@@ -165,11 +160,14 @@ class TestDoorsAPI:
             assert data["default_schedule"] is None
             
         finally:
-            # Clean up dependency overrides
-            client.app.dependency_overrides.clear()
+            # Drop only the repository override; _as_admin removes its own
+            client.app.dependency_overrides.pop(get_door_repository, None)
 
     def test_create_door_unauthorized(self, client):
         """Test door creation without authentication"""
+        from app.api.dependencies.auth_dependencies import get_current_active_user
+        del client.app.dependency_overrides[get_current_active_user]
+        
         door_data = {
             "name": "Test Door",
             "location": "Building A",
@@ -182,11 +180,8 @@ class TestDoorsAPI:
         assert response.status_code == 401
         assert "Not authenticated" in response.json()["detail"]
 
-    def test_create_door_validation_error(self, client, mock_admin_user):
+    def test_create_door_validation_error(self, client):
         """Test door creation with invalid data"""
-        # Setup authentication
-        self.setup_auth_override(client, mock_admin_user)
-        
         # Make request with invalid data
         door_data = {
             "name": "",  # Empty name should fail validation
@@ -195,25 +190,20 @@ class TestDoorsAPI:
             "security_level": "invalid_level"  # Invalid security level
         }
         
-        try:
-            response = client.post("/api/v1/doors/", json=door_data, headers={"Authorization": "Bearer fake_token"})
-            
-            # Verify validation error
-            assert response.status_code == 422
-        finally:
-            self.cleanup_overrides(client)
+        response = client.post("/api/v1/doors/", json=door_data, headers={"Authorization": "Bearer fake_token"})
+        
+        # Verify validation error
+        assert response.status_code == 422
 
-    def test_get_door_success(self, client, mock_admin_user):
+    def test_get_door_success(self, client):
         """Test successful door retrieval"""
         # Create mocks
         mock_door_repository = AsyncMock()
         
         # Use FastAPI dependency override system
         from app.api.v1.doors import get_door_repository
-        from app.api.dependencies.auth_dependencies import get_current_active_user
         
         client.app.dependency_overrides[get_door_repository] = lambda: mock_door_repository
-        client.app.dependency_overrides[get_current_active_user] = lambda: mock_admin_user
         
         try:
             # Mock door retrieval
@@ -249,20 +239,18 @@ class TestDoorsAPI:
             assert data["name"] == "Main Entrance"
             assert data["id"] == str(SAMPLE_DOOR_UUID)
         finally:
-            # Clean up dependency overrides
-            client.app.dependency_overrides.clear()
+            # Drop only the repository override; _as_admin removes its own
+            client.app.dependency_overrides.pop(get_door_repository, None)
 
-    def test_get_door_not_found(self, client, mock_admin_user):
+    def test_get_door_not_found(self, client):
         """Test door retrieval when door doesn't exist"""
         # Create mocks
         mock_door_repository = AsyncMock()
         
         # Use FastAPI dependency override system
         from app.api.v1.doors import get_door_repository
-        from app.api.dependencies.auth_dependencies import get_current_active_user
         
         client.app.dependency_overrides[get_door_repository] = lambda: mock_door_repository
-        client.app.dependency_overrides[get_current_active_user] = lambda: mock_admin_user
         
         try:
             # Mock repository to return None (door not found)
@@ -273,20 +261,18 @@ class TestDoorsAPI:
             # Verify not found response
             assert response.status_code == 404
         finally:
-            # Clean up dependency overrides
-            client.app.dependency_overrides.clear()
+            # Drop only the repository override; _as_admin removes its own
+            client.app.dependency_overrides.pop(get_door_repository, None)
 
-    def test_get_door_by_name_success(self, client, mock_admin_user):
+    def test_get_door_by_name_success(self, client):
         """Test door retrieval by name"""
         # Create mocks
         mock_door_repository = AsyncMock()
         
         # Use FastAPI dependency override system
         from app.api.v1.doors import get_door_repository
-        from app.api.dependencies.auth_dependencies import get_current_active_user
         
         client.app.dependency_overrides[get_door_repository] = lambda: mock_door_repository
-        client.app.dependency_overrides[get_current_active_user] = lambda: mock_admin_user
         
         try:
             # Mock door retrieval
@@ -316,20 +302,18 @@ class TestDoorsAPI:
             data = response.json()
             assert data["name"] == "Main Entrance"
         finally:
-            # Clean up dependency overrides
-            client.app.dependency_overrides.clear()
+            # Drop only the repository override; _as_admin removes its own
+            client.app.dependency_overrides.pop(get_door_repository, None)
 
-    def test_get_doors_by_location_success(self, client, mock_admin_user):
+    def test_get_doors_by_location_success(self, client):
         """Test door retrieval by location"""
         # Create mocks
         mock_door_repository = AsyncMock()
         
         # Use FastAPI dependency override system
         from app.api.v1.doors import get_door_repository
-        from app.api.dependencies.auth_dependencies import get_current_active_user
         
         client.app.dependency_overrides[get_door_repository] = lambda: mock_door_repository
-        client.app.dependency_overrides[get_current_active_user] = lambda: mock_admin_user
         
         try:
             # Mock doors retrieval
@@ -362,286 +346,218 @@ class TestDoorsAPI:
             assert len(data) == 1
             assert data[0]["location"] == "Building A"
         finally:
-            # Clean up dependency overrides
-            client.app.dependency_overrides.clear()
+            # Drop only the repository override; _as_admin removes its own
+            client.app.dependency_overrides.pop(get_door_repository, None)
 
-    def test_get_doors_by_security_level_success(self, client, mock_admin_user):
+    def test_get_doors_by_security_level_success(self, client, door_mocks):
         """Test door retrieval by security level"""
-        with patch('app.api.v1.doors.GetDoorsBySecurityLevelUseCase') as mock_use_case_class:
-            
-            # Setup authentication
-            self.setup_auth_override(client, mock_admin_user)
-            
-            # Mock the use case
-            mock_use_case = AsyncMock()
-            mock_use_case_class.return_value = mock_use_case
-            
-            # Mock doors retrieval
-            now = datetime.now(UTC).replace(tzinfo=None)
-            doors = [
-                Door(
-                    id=SAMPLE_DOOR_UUID,
-                    name="Secure Door",
-                    location="Building A",
-                    door_type=DoorType.EMERGENCY,
-                    security_level=SecurityLevel.HIGH,
-                    status=DoorStatus.ACTIVE,
-                    created_at=now,
-                    updated_at=now,
-                    description="High security door",
-                    default_schedule=None,
-                    requires_pin=True,
-                    max_attempts=3,
-                    lockout_duration=300,
-                    failed_attempts=0
-                )
-            ]
-            mock_use_case.execute.return_value = doors
-            
-            try:
-                response = client.get("/api/v1/doors/security-level/high", headers={"Authorization": "Bearer fake_token"})
-                
-                # Verify response
-                assert response.status_code == 200
-                data = response.json()
-                assert len(data) == 1
-                assert data[0]["security_level"] == "high"
-            finally:
-                self.cleanup_overrides(client)
+        # Stub the use case
+        use_case_stub = door_mocks["GetDoorsBySecurityLevelUseCase"]
+        
+        # Mock doors retrieval
+        doors = [
+            Door(
+                id=SAMPLE_DOOR_UUID,
+                name="Secure Door",
+                location="Building A",
+                door_type=DoorType.EMERGENCY,
+                security_level=SecurityLevel.HIGH,
+                status=DoorStatus.ACTIVE,
+                created_at=SAMPLE_NOW,
+                updated_at=SAMPLE_NOW,
+                description="High security door",
+                default_schedule=None,
+                requires_pin=True,
+                max_attempts=3,
+                lockout_duration=300,
+                failed_attempts=0
+            )
+        ]
+        use_case_stub.ret = doors
+        
+        response = client.get("/api/v1/doors/security-level/high", headers={"Authorization": "Bearer fake_token"})
+        
+        # Verify response
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["security_level"] == "high"
 
-    def test_list_doors_success(self, client, mock_admin_user):
+    def test_list_doors_success(self, client, door_mocks):
         """Test listing all doors"""
-        with patch('app.api.v1.doors.ListDoorsUseCase') as mock_use_case_class:
-            
-            # Setup authentication
-            self.setup_auth_override(client, mock_admin_user)
-            
-            # Mock the use case
-            mock_use_case = AsyncMock()
-            mock_use_case_class.return_value = mock_use_case
-            
-            # Mock doors retrieval
-            now = datetime.now(UTC).replace(tzinfo=None)
-            doors = [
-                Door(
-                    id=SAMPLE_DOOR_UUID,
-                    name="Door 1",
-                    location="Building A",
-                    door_type=DoorType.ENTRANCE,
-                    security_level=SecurityLevel.MEDIUM,
-                    status=DoorStatus.ACTIVE,
-                    created_at=now,
-                    updated_at=now,
-                    description="First door",
-                    default_schedule=None,
-                    requires_pin=False,
-                    max_attempts=3,
-                    lockout_duration=300,
-                    failed_attempts=0
-                ),
-                Door(
-                    id=SAMPLE_DOOR_UUID_2,
-                    name="Door 2",
-                    location="Building B",
-                    door_type=DoorType.ENTRANCE,
-                    security_level=SecurityLevel.LOW,
-                    status=DoorStatus.ACTIVE,
-                    created_at=now,
-                    updated_at=now,
-                    description="Second door",
-                    default_schedule=None,
-                    requires_pin=False,
-                    max_attempts=3,
-                    lockout_duration=300,
-                    failed_attempts=0
-                )
-            ]
-            mock_use_case.execute.return_value = doors
-            
-            try:
-                response = client.get("/api/v1/doors/", headers={"Authorization": "Bearer fake_token"})
-                
-                # Verify response
-                assert response.status_code == 200
-                data = response.json()
-                assert len(data["doors"]) == 2  # Access doors array in DoorListResponse
-            finally:
-                self.cleanup_overrides(client)
-
-    def test_list_doors_active_only(self, client, mock_admin_user):
-        """Test listing only active doors"""
-        with patch('app.api.v1.doors.GetActiveDoorsUseCase') as mock_use_case_class:
-            
-            # Setup authentication
-            self.setup_auth_override(client, mock_admin_user)
-            
-            # Mock the use case
-            mock_use_case = AsyncMock()
-            mock_use_case_class.return_value = mock_use_case
-            
-            # Mock active doors retrieval
-            now = datetime.now(UTC).replace(tzinfo=None)
-            doors = [
-                Door(
-                    id=SAMPLE_DOOR_UUID,
-                    name="Active Door",
-                    location="Building A",
-                    door_type=DoorType.ENTRANCE,
-                    security_level=SecurityLevel.MEDIUM,
-                    status=DoorStatus.ACTIVE,
-                    created_at=now,
-                    updated_at=now,
-                    description="Active door",
-                    default_schedule=None,
-                    requires_pin=False,
-                    max_attempts=3,
-                    lockout_duration=300,
-                    failed_attempts=0
-                )
-            ]
-            mock_use_case.execute.return_value = doors
-            
-            try:
-                response = client.get("/api/v1/doors/?active_only=true", headers={"Authorization": "Bearer fake_token"})
-                
-                # Verify response
-                assert response.status_code == 200
-                data = response.json()
-                assert len(data["doors"]) == 1  # Access doors array in DoorListResponse
-                assert data["doors"][0]["status"] == "active"
-            finally:
-                self.cleanup_overrides(client)
-
-    def test_update_door_success(self, client, mock_admin_user):
-        """Test successful door update"""
-        with patch('app.api.v1.doors.UpdateDoorUseCase') as mock_use_case_class:
-            
-            # Setup authentication
-            self.setup_auth_override(client, mock_admin_user)
-            
-            # Mock the use case
-            mock_use_case = AsyncMock()
-            mock_use_case_class.return_value = mock_use_case
-            
-            # Mock updated door
-            now = datetime.now(UTC).replace(tzinfo=None)
-            updated_door = Door(
+        # Stub the use case
+        use_case_stub = door_mocks["ListDoorsUseCase"]
+        
+        # Mock doors retrieval
+        doors = [
+            Door(
                 id=SAMPLE_DOOR_UUID,
-                name="Updated Door",
+                name="Door 1",
                 location="Building A",
                 door_type=DoorType.ENTRANCE,
-                security_level=SecurityLevel.HIGH,
+                security_level=SecurityLevel.MEDIUM,
                 status=DoorStatus.ACTIVE,
-                created_at=now,
-                updated_at=now,
-                description="Updated description",
+                created_at=SAMPLE_NOW,
+                updated_at=SAMPLE_NOW,
+                description="First door",
                 default_schedule=None,
-                requires_pin=True,
-                max_attempts=5,
-                lockout_duration=600,
+                requires_pin=False,
+                max_attempts=3,
+                lockout_duration=300,
+                failed_attempts=0
+            ),
+            Door(
+                id=SAMPLE_DOOR_UUID_2,
+                name="Door 2",
+                location="Building B",
+                door_type=DoorType.ENTRANCE,
+                security_level=SecurityLevel.LOW,
+                status=DoorStatus.ACTIVE,
+                created_at=SAMPLE_NOW,
+                updated_at=SAMPLE_NOW,
+                description="Second door",
+                default_schedule=None,
+                requires_pin=False,
+                max_attempts=3,
+                lockout_duration=300,
                 failed_attempts=0
             )
-            mock_use_case.execute.return_value = updated_door
-            
-            update_data = {
-                "name": "Updated Door",
-                "security_level": "high",
-                "description": "Updated description",
-                "requires_pin": True,
-                "max_attempts": 5,
-                "lockout_duration": 600
-            }
-            
-            try:
-                response = client.put(f"/api/v1/doors/{SAMPLE_DOOR_UUID}", json=update_data, headers={"Authorization": "Bearer fake_token"})
-                
-                # Verify response
-                assert response.status_code == 200
-                data = response.json()
-                assert data["name"] == "Updated Door"
-                assert data["security_level"] == "high"
-            finally:
-                self.cleanup_overrides(client)
+        ]
+        use_case_stub.ret = doors
+        
+        response = client.get("/api/v1/doors/", headers={"Authorization": "Bearer fake_token"})
+        
+        # Verify response
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["doors"]) == 2  # Access doors array in DoorListResponse
 
-    def test_set_door_status_success(self, client, mock_admin_user):
-        """Test setting door status"""
-        with patch('app.api.v1.doors.SetDoorStatusUseCase') as mock_use_case_class:
-            
-            # Setup authentication
-            self.setup_auth_override(client, mock_admin_user)
-            
-            # Mock the use case
-            mock_use_case = AsyncMock()
-            mock_use_case_class.return_value = mock_use_case
-            
-            # Mock door with updated status
-            now = datetime.now(UTC).replace(tzinfo=None)
-            door = Door(
+    def test_list_doors_active_only(self, client, door_mocks):
+        """Test listing only active doors"""
+        # Stub the use case
+        use_case_stub = door_mocks["GetActiveDoorsUseCase"]
+        
+        # Mock active doors retrieval
+        doors = [
+            Door(
                 id=SAMPLE_DOOR_UUID,
-                name="Test Door",
+                name="Active Door",
                 location="Building A",
                 door_type=DoorType.ENTRANCE,
                 security_level=SecurityLevel.MEDIUM,
-                status=DoorStatus.MAINTENANCE,
-                created_at=now,
-                updated_at=now,
-                description="Test door",
+                status=DoorStatus.ACTIVE,
+                created_at=SAMPLE_NOW,
+                updated_at=SAMPLE_NOW,
+                description="Active door",
                 default_schedule=None,
                 requires_pin=False,
                 max_attempts=3,
                 lockout_duration=300,
                 failed_attempts=0
             )
-            mock_use_case.execute.return_value = door
-            
-            status_data = {"status": "maintenance"}
-            
-            try:
-                response = client.post(f"/api/v1/doors/{SAMPLE_DOOR_UUID}/status", json=status_data, headers={"Authorization": "Bearer fake_token"})
-                
-                # Verify response
-                assert response.status_code == 200
-                data = response.json()
-                assert data["status"] == "maintenance"
-            finally:
-                self.cleanup_overrides(client)
+        ]
+        use_case_stub.ret = doors
+        
+        response = client.get("/api/v1/doors/?active_only=true", headers={"Authorization": "Bearer fake_token"})
+        
+        # Verify response
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["doors"]) == 1  # Access doors array in DoorListResponse
+        assert data["doors"][0]["status"] == "active"
+
+    def test_update_door_success(self, client, door_mocks):
+        """Test successful door update"""
+        # Stub the use case
+        use_case_stub = door_mocks["UpdateDoorUseCase"]
+        
+        # Mock updated door
+        updated_door = Door(
+            id=SAMPLE_DOOR_UUID,
+            name="Updated Door",
+            location="Building A",
+            door_type=DoorType.ENTRANCE,
+            security_level=SecurityLevel.HIGH,
+            status=DoorStatus.ACTIVE,
+            created_at=SAMPLE_NOW,
+            updated_at=SAMPLE_NOW,
+            description="Updated description",
+            default_schedule=None,
+            requires_pin=True,
+            max_attempts=5,
+            lockout_duration=600,
+            failed_attempts=0
+        )
+        use_case_stub.ret = updated_door
+        
+        update_data = {
+            "name": "Updated Door",
+            "security_level": "high",
+            "description": "Updated description",
+            "requires_pin": True,
+            "max_attempts": 5,
+            "lockout_duration": 600
+        }
+        
+        response = client.put(f"/api/v1/doors/{SAMPLE_DOOR_UUID}", json=update_data, headers={"Authorization": "Bearer fake_token"})
+        
+        # Verify response
+        assert response.status_code == 200
+        data = response.json()
+        assert data["name"] == "Updated Door"
+        assert data["security_level"] == "high"
+
+    def test_set_door_status_success(self, client, door_mocks):
+        """Test setting door status"""
+        # Stub the use case
+        use_case_stub = door_mocks["SetDoorStatusUseCase"]
+        
+        # Mock door with updated status
+        door = Door(
+            id=SAMPLE_DOOR_UUID,
+            name="Test Door",
+            location="Building A",
+            door_type=DoorType.ENTRANCE,
+            security_level=SecurityLevel.MEDIUM,
+            status=DoorStatus.MAINTENANCE,
+            created_at=SAMPLE_NOW,
+            updated_at=SAMPLE_NOW,
+            description="Test door",
+            default_schedule=None,
+            requires_pin=False,
+            max_attempts=3,
+            lockout_duration=300,
+            failed_attempts=0
+        )
+        use_case_stub.ret = door
+        
+        status_data = {"status": "maintenance"}
+        
+        response = client.post(f"/api/v1/doors/{SAMPLE_DOOR_UUID}/status", json=status_data, headers={"Authorization": "Bearer fake_token"})
+        
+        # Verify response
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "maintenance"
 
-    def test_delete_door_success(self, client, mock_admin_user):
+    def test_delete_door_success(self, client, door_mocks):
         """Test successful door deletion"""
-        with patch('app.api.v1.doors.DeleteDoorUseCase') as mock_use_case_class:
-            
-            # Setup authentication
-            self.setup_auth_override(client, mock_admin_user)
-            
-            # Mock the use case
-            mock_use_case = AsyncMock()
-            mock_use_case_class.return_value = mock_use_case
-            mock_use_case.execute.return_value = True
-            
-            try:
-                response = client.delete(f"/api/v1/doors/{SAMPLE_DOOR_UUID}", headers={"Authorization": "Bearer fake_token"})
-                
-                # Verify response
-                assert response.status_code == 204
-            finally:
-                self.cleanup_overrides(client)
+        # Stub the use case
+        use_case_stub = door_mocks["DeleteDoorUseCase"]
+        use_case_stub.ret = True
+        
+        response = client.delete(f"/api/v1/doors/{SAMPLE_DOOR_UUID}", headers={"Authorization": "Bearer fake_token"})
+        
+        # Verify response
+        assert response.status_code == 204
 
-    def test_delete_door_not_found(self, client, mock_admin_user):
+    def test_delete_door_not_found(self, client, door_mocks):
         """Test door deletion when door doesn't exist"""
-        with patch('app.api.v1.doors.DeleteDoorUseCase') as mock_use_case_class:
-            
-            # Setup authentication
-            self.setup_auth_override(client, mock_admin_user)
-            
-            # Mock the use case
-            mock_use_case = AsyncMock()
-            mock_use_case_class.return_value = mock_use_case
-            mock_use_case.execute.return_value = False
-            
-            try:
-                response = client.delete(f"/api/v1/doors/{SAMPLE_DOOR_UUID}", headers={"Authorization": "Bearer fake_token"})
-                
-                # Verify not found response
-                assert response.status_code == 404
-            finally:
-                self.cleanup_overrides(client)
\ No newline at end of file
+        # Stub the use case
+        use_case_stub = door_mocks["DeleteDoorUseCase"]
+        use_case_stub.ret = False
+        
+        response = client.delete(f"/api/v1/doors/{SAMPLE_DOOR_UUID}", headers={"Authorization": "Bearer fake_token"})
+        
+        # Verify not found response
+        assert response.status_code == 404
\ No newline at end of file
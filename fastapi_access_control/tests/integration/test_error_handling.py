@@ -2,7 +2,7 @@
 Integration tests for error handling and edge cases.
 """
 import pytest
-from httpx import AsyncClient
+from httpx import AsyncClient, ASGITransport
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timezone
 from unittest.mock import patch, AsyncMock
@@ -20,8 +20,8 @@ class TestErrorHandling:
     """Integration tests for error handling scenarios."""
     @pytest.fixture
     async def client(self):
-        """HTTP client for testing."""
-        async with AsyncClient(app=app, base_url="http://test") as ac:
+        """HTTP client for testing; ASGITransport skips the app lifespan."""
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
             yield ac
     
     @pytest.fixture
@@ -179,7 +179,7 @@ class TestErrorHandling:
         """Test API response when Content-Type header is missing."""
         response = await client.post(
             "/api/v1/access/validate",
-            content=f'{"card_id": "TEST123", "door_id": "{SAMPLE_DOOR_UUID}"}'
+            content=f'{{"card_id": "TEST123", "door_id": "{SAMPLE_DOOR_UUID}"}}'
             # No Content-Type header
         )
         
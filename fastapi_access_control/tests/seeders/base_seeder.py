@@ -103,15 +103,20 @@ class TransactionalSeeder(BaseSeeder):
 class BulkSeeder(BaseSeeder):
     """Seeder optimized for bulk operations."""
     
-    async def bulk_save_objects(self, objects: List[Any]) -> List[Any]:
-        """Bulk save objects for better performance."""
+    async def bulk_save_objects(self, objects: List[Any], refresh: bool = True) -> List[Any]:
+        """Bulk save objects for better performance.
+        
+        Pass refresh=False when every column is set client-side (as the model
+        factories do) to skip the per-object SELECT after the flush.
+        """
         try:
             self.session.add_all(objects)
             await self.session.flush()
             
             # Refresh all objects to get IDs and computed fields
             for obj in objects:
-                await self.session.refresh(obj)
+                if refresh:
+                    await self.session.refresh(obj)
                 self._created_objects.append(obj)
             
             return objects
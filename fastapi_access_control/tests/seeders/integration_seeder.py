@@ -80,63 +80,64 @@ class IntegrationSeeder(BulkSeeder):
         """Seed data specifically for complete access flow tests."""
         logger.info("Seeding complete access flow test data")
         
-        # Create admin user
-        admin = await self._save_object(UserModelFactory.create_admin(
+        # Build every row in memory; the factories assign ids up front, so
+        # relationships can be wired before anything reaches the database
+        admin = UserModelFactory.create_admin(
             email="flow_admin@test.com",
             full_name="Flow Test Admin"
-        ))
+        )
         
-        # Create regular user
-        user = await self._save_object(UserModelFactory.create(
+        user = UserModelFactory.create(
             email="flow_user@test.com",
             full_name="Flow Test User"
-        ))
+        )
         
-        # Create test doors with different security levels
-        low_security_door = await self._save_object(DoorModelFactory.create_low_security(
+        # Test doors with different security levels
+        low_security_door = DoorModelFactory.create_low_security(
             name="Low Security Test Door",
             location="Test Building - Floor 1"
-        ))
+        )
         
-        medium_security_door = await self._save_object(DoorModelFactory.create(
+        medium_security_door = DoorModelFactory.create(
             name="Medium Security Test Door",
             location="Test Building - Floor 2",
             security_level="MEDIUM"
-        ))
+        )
         
-        high_security_door = await self._save_object(DoorModelFactory.create_high_security(
+        high_security_door = DoorModelFactory.create_high_security(
             name="High Security Test Door",
             location="Test Building - Server Room"
-        ))
+        )
         
-        # Create cards
-        admin_master_card = await self._save_object(CardModelFactory.create_master(
+        # Cards
+        admin_master_card = CardModelFactory.create_master(
             user_id=admin.id,
             card_id="FLOW_ADMIN_MASTER"
-        ))
+        )
         
-        user_standard_card = await self._save_object(CardModelFactory.create(
+        user_standard_card = CardModelFactory.create(
             user_id=user.id,
             card_id="FLOW_USER_STANDARD"
-        ))
-        
-        # Create comprehensive permissions
-        permissions = []
+        )
         
         # Admin gets access to all doors
-        for door in [low_security_door, medium_security_door, high_security_door]:
-            permission = await self._save_object(
-                PermissionModelFactory.create_for_user_and_door(admin.id, door.id)
-            )
-            permissions.append(permission)
+        permissions = [
+            PermissionModelFactory.create_for_user_and_door(admin.id, door.id)
+            for door in [low_security_door, medium_security_door, high_security_door]
+        ]
         
         # Regular user gets access to low and medium security doors only
-        for door in [low_security_door, medium_security_door]:
-            permission = await self._save_object(
-                PermissionModelFactory.create_for_user_and_door(user.id, door.id)
-            )
-            permissions.append(permission)
+        permissions.extend(
+            PermissionModelFactory.create_for_user_and_door(user.id, door.id)
+            for door in [low_security_door, medium_security_door]
+        )
         
+        # One flush (ordered by foreign keys) and one commit for the whole set
+        await self.bulk_save_objects(
+            [admin, user, low_security_door, medium_security_door, high_security_door,
+             admin_master_card, user_standard_card, *permissions],
+            refresh=False
+        )
         await self._commit_changes()
         
         return {
@@ -10,8 +10,6 @@ from tests.factories import UserModelFactory, CardModelFactory, DoorModelFactory
 from tests.seeders import TestScenarios, IntegrationSeeder
 from tests.conftest import db_session
 
-pytestmark = pytest.mark.asyncio
-
 
 class TestEntityFactories:
     """Test the domain entity factories."""
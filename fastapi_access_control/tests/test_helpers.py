@@ -1,8 +1,11 @@
 """
 Test helpers for UUID generation and common test patterns
 """
+from typing import Any, Dict
 from uuid import UUID, uuid4
 
+import orjson
+
 
 def create_test_uuid(seed: str) -> UUID:
     """Create consistent UUIDs for testing based on seed string"""
@@ -33,4 +36,13 @@ TEST_DOOR_ID_2 = create_test_uuid("door2")
 TEST_PERMISSION_ID_1 = create_test_uuid("permission1")
 TEST_PERMISSION_ID_2 = create_test_uuid("permission2")
 TEST_MQTT_ID_1 = create_test_uuid("mqtt1")
-TEST_NONEXISTENT_ID = create_test_uuid("nonexistent")
\ No newline at end of file
+TEST_NONEXISTENT_ID = create_test_uuid("nonexistent")
+
+
+def assert_json(response, status_code: int, **expected: Any) -> Dict[str, Any]:
+    """Assert the status and expected top-level fields of a JSON response, parsing the body once"""
+    assert response.status_code == status_code, response.content
+    data = orjson.loads(response.content)
+    mismatched = {key: data.get(key) for key, value in expected.items() if data.get(key) != value}
+    assert not mismatched, f"expected {expected}, got {mismatched}"
+    return data